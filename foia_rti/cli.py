@@ -276,9 +276,8 @@ def track(
         return
 
     if request_id and add_note:
-        req = db.add_note(request_id, add_note)
-        if req:
-            click.echo(f"Note added to request #{req.id}.")
+        if db.add_note(request_id, add_note):
+            click.echo(f"Note added to request #{request_id}.")
         else:
             click.echo(f"Request #{request_id} not found.")
         return
@@ -306,13 +305,14 @@ def track(
         return
 
     if overdue:
-        requests = db.get_overdue()
+        requests = db.list_overdue(summary=True)
         if not requests:
             click.echo("No overdue requests.")
             return
         click.echo(f"Overdue requests ({len(requests)}):")
+        today = date.today()
         for req in requests:
-            days = req.days_until_deadline()
+            days = req.days_until_deadline(today)
             click.echo(
                 f"  #{req.id} | {req.agency[:40]:40s} | "
                 f"{req.status.value:15s} | {abs(days or 0)} days overdue"
@@ -320,14 +320,15 @@ def track(
         return
 
     # Default: list all
-    requests = db.list_requests(jurisdiction=jurisdiction, agency=agency)
+    requests = db.list_requests(jurisdiction=jurisdiction, agency=agency, summary=True)
     if not requests:
         click.echo("No tracked requests.")
         return
 
     click.echo(f"Tracked requests ({len(requests)}):")
+    today = date.today()
     for req in requests:
-        days = req.days_until_deadline()
+        days = req.days_until_deadline(today)
         days_str = f"{days}d" if days is not None else "N/A"
         click.echo(
             f"  #{req.id:4d} | {req.jurisdiction:15s} | {req.agency[:35]:35s} | "
@@ -264,11 +264,10 @@ class DispatchRunner:
 
             # --- Track in database (skip for dry-run) ---
             if not dry_run:
-                from foia_rti.tracker.deadlines import DeadlineCalculator
+                from foia_rti.tracker.deadlines import compute_deadline
 
                 filed_date = date.today()
-                calc = DeadlineCalculator()
-                deadline = calc.calculate(target.jurisdiction, filed_date)
+                deadline = compute_deadline(target.jurisdiction, filed_date)
 
                 topic = target.topic_override or generated.context.topic
                 req = self.db.create_request(
@@ -9,16 +9,81 @@ from __future__ import annotations
 
 import json
 import os
+import sys
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from dataclasses import dataclass, field, replace
 from datetime import date, datetime
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Optional
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Optional
 
-from jinja2 import Environment, FileSystemLoader, BaseLoader
+if TYPE_CHECKING:
+    from jinja2 import Environment, Template
 
 
-@dataclass
+# Template sources that generators load by name. Templates loaded through
+# the environment's loader go through Jinja's bytecode cache, so a fresh
+# process loads the compiled template from disk instead of recompiling it.
+TEMPLATE_SOURCES: dict[str, str] = {}
+
+
+def register_template(name: str, source: str) -> str:
+    """Register a template source under *name* and return the name."""
+    TEMPLATE_SOURCES[name] = source
+    return name
+
+
+@lru_cache(maxsize=None)
+def _environment() -> Environment:
+    """
+    The Jinja2 environment shared by every generator instance.
+
+    Compiled bytecode for registered templates is cached in Jinja's default
+    per-user directory under the system temp dir (``_jinja2-cache-<uid>``),
+    which Jinja creates with owner-only permissions.
+
+    Jinja2 is imported here rather than at module level so that code paths
+    which never render (listing agencies, legal basis, appeal info) do not
+    pay for the import.
+    """
+    from jinja2 import Environment, FileSystemBytecodeCache, FunctionLoader
+
+    return Environment(
+        loader=FunctionLoader(TEMPLATE_SOURCES.get),
+        bytecode_cache=FileSystemBytecodeCache(),
+        trim_blocks=True,
+        lstrip_blocks=True,
+        keep_trailing_newline=True,
+        auto_reload=False,
+    )
+
+
+def freeze_registry(
+    registry: Mapping[str, Mapping[str, str]],
+    defaults: Optional[Mapping[str, str]] = None,
+) -> Mapping[str, Mapping[str, str]]:
+    """
+    Return a read-only copy of an agency registry.
+
+    Missing keys are filled from *defaults* so callers can index entries
+    directly instead of going through ``.get(key, default)``. String values
+    are interned since the same few are looked up on every render.
+    """
+    frozen = {}
+    for key, info in registry.items():
+        key = sys.intern(key)
+        entry = dict(defaults or {})
+        entry.update(info)
+        frozen[key] = MappingProxyType(
+            {k: sys.intern(v) if isinstance(v, str) else v for k, v in entry.items()}
+        )
+    return MappingProxyType(frozen)
+
+
+@dataclass(slots=True)
 class RequestContext:
     """All parameters needed to generate a public records request."""
 
@@ -58,8 +123,22 @@ class RequestContext:
     def filing_date(self) -> str:
         return datetime.now().strftime("%B %d, %Y")
 
+    def merged_with_template(self, template: Mapping[str, Any]) -> RequestContext:
+        """
+        Return a copy with a pre-built template's records prepended and its
+        keywords used when none were given. The original is left unchanged.
+        """
+        keywords = self.keywords
+        if not keywords and template.get("keywords"):
+            keywords = list(template["keywords"])
+        return replace(
+            self,
+            specific_records=[*template.get("records", ()), *self.specific_records],
+            keywords=keywords,
+        )
 
-@dataclass
+
+@dataclass(slots=True)
 class GeneratedRequest:
     """Output of a request generation."""
 
@@ -86,6 +165,75 @@ class GeneratedRequest:
         }
 
 
+# Render variables taken from the request context, by template variable
+# name. Only the ones a template actually references are computed.
+_CONTEXT_VARS: dict[str, Callable[[RequestContext], Any]] = {
+    "ctx": lambda c: c,
+    "agency": attrgetter("agency"),
+    "topic": attrgetter("topic"),
+    "date_range": attrgetter("date_range_str"),
+    "filing_date": attrgetter("filing_date"),
+    "requester_name": attrgetter("requester_name"),
+    "requester_org": attrgetter("requester_organization"),
+    "requester_address": attrgetter("requester_address"),
+    "requester_email": attrgetter("requester_email"),
+    "requester_phone": attrgetter("requester_phone"),
+    "specific_records": attrgetter("specific_records"),
+    "keywords": attrgetter("keywords"),
+    "keywords_str": lambda c: ", ".join(c.keywords),
+    "facilities": attrgetter("facilities"),
+    "facilities_str": lambda c: "; ".join(c.facilities),
+    "preferred_format": attrgetter("preferred_format"),
+    "additional_notes": attrgetter("additional_notes"),
+}
+
+_ContextGetters = tuple[tuple[str, Callable[[RequestContext], Any]], ...]
+
+# Compiled templates and their context getters, keyed by registered name or
+# template source and shared across generator instances so each template is
+# compiled once per process.
+_COMPILED: dict[str, tuple[Template, _ContextGetters]] = {}
+
+
+def _compile(template: str) -> tuple[Template, _ContextGetters]:
+    entry = _COMPILED.get(template)
+    if entry is None:
+        env = _environment()
+        source = TEMPLATE_SOURCES.get(template)
+        if source is None:
+            source = template
+            compiled = env.from_string(source)
+        else:
+            compiled = env.get_template(template)
+        from jinja2 import meta
+
+        names = meta.find_undeclared_variables(env.parse(source))
+        getters = tuple(
+            (name, getter) for name, getter in _CONTEXT_VARS.items() if name in names
+        )
+        entry = _COMPILED[template] = (compiled, getters)
+    return entry
+
+
+def compile_template(template: str) -> Template:
+    """Return the compiled form of a registered template name or a template source."""
+    return _compile(template)[0]
+
+
+def context_values(template: str, context: RequestContext) -> tuple[tuple[str, Any], ...]:
+    """
+    Return the (name, value) pairs *template* reads from *context*.
+
+    Lists are converted to tuples so the result is hashable and can key a
+    render cache. Templates that reference ``ctx`` directly cannot be keyed
+    this way.
+    """
+    return tuple(
+        (name, tuple(value) if isinstance(value, list) else value)
+        for name, value in ((name, getter(context)) for name, getter in _compile(template)[1])
+    )
+
+
 class RequestGenerator(ABC):
     """
     Abstract base class for all jurisdiction-specific request generators.
@@ -99,12 +247,6 @@ class RequestGenerator(ABC):
     TEMPLATES_DIR = Path(__file__).resolve().parent.parent.parent / "templates"
 
     def __init__(self, templates_file: Optional[str] = None):
-        self._jinja_env = Environment(
-            loader=BaseLoader(),
-            trim_blocks=True,
-            lstrip_blocks=True,
-            keep_trailing_newline=True,
-        )
         self._templates: dict[str, Any] = {}
         if templates_file:
             self._load_templates(templates_file)
@@ -115,27 +257,11 @@ class RequestGenerator(ABC):
             with open(filepath, "r", encoding="utf-8") as f:
                 self._templates = json.load(f)
 
-    def _render(self, template_str: str, context: RequestContext, **extra: Any) -> str:
-        template = self._jinja_env.from_string(template_str)
-        ctx_vars = {
-            "ctx": context,
-            "agency": context.agency,
-            "topic": context.topic,
-            "date_range": context.date_range_str,
-            "filing_date": context.filing_date,
-            "requester_name": context.requester_name,
-            "requester_org": context.requester_organization,
-            "requester_address": context.requester_address,
-            "requester_email": context.requester_email,
-            "requester_phone": context.requester_phone,
-            "specific_records": context.specific_records,
-            "keywords": context.keywords,
-            "facilities": context.facilities,
-            "preferred_format": context.preferred_format,
-            "additional_notes": context.additional_notes,
-        }
+    def _render(self, template: str, context: RequestContext, **extra: Any) -> str:
+        compiled, getters = _compile(template)
+        ctx_vars = {name: getter(context) for name, getter in getters}
         ctx_vars.update(extra)
-        return template.render(**ctx_vars)
+        return compiled.render(ctx_vars)
 
     def get_template(self, template_id: str) -> Optional[dict[str, Any]]:
         """Retrieve a pre-built template by ID from the loaded templates file."""
@@ -152,14 +278,31 @@ class RequestGenerator(ABC):
             for t in self._templates.get("templates", [])
         ]
 
+    def count_templates(self) -> int:
+        """Return the number of pre-built templates, without building their summaries."""
+        return len(self._templates.get("templates", ()))
+
+    def generate_many(
+        self, contexts: Iterable[RequestContext], **kwargs: Any
+    ) -> Iterator[GeneratedRequest]:
+        """
+        Lazily generate one request per context.
+
+        Keyword arguments are passed through to generate() for every
+        context, so e.g. ``language="hindi"`` applies to the whole batch.
+        """
+        generate = self.generate
+        for context in contexts:
+            yield generate(context, **kwargs)
+
     @abstractmethod
     def generate(self, context: RequestContext) -> GeneratedRequest:
         """Generate a complete public records request."""
         ...
 
     @abstractmethod
-    def get_agencies(self) -> dict[str, dict[str, str]]:
-        """Return a dict of known agencies with contact info."""
+    def get_agencies(self) -> Mapping[str, Mapping[str, str]]:
+        """Return a mapping of known agencies with contact info."""
         ...
 
     @abstractmethod
@@ -173,6 +316,6 @@ class RequestGenerator(ABC):
         ...
 
     @abstractmethod
-    def get_appeal_info(self) -> dict[str, str]:
+    def get_appeal_info(self) -> Mapping[str, str]:
         """Return information about the appeals process."""
         ...
@@ -10,12 +10,15 @@ Supports bilingual output (English and Hindi).
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from typing import Any, Optional
 
 from foia_rti.generators.generator_base import (
     GeneratedRequest,
     RequestContext,
     RequestGenerator,
+    freeze_registry,
+    register_template,
 )
 
 
@@ -23,7 +26,7 @@ from foia_rti.generators.generator_base import (
 # Public authority registry
 # ---------------------------------------------------------------------------
 
-INDIA_AGENCIES: dict[str, dict[str, str]] = {
+INDIA_AGENCIES: Mapping[str, Mapping[str, str]] = {
     "AWBI": {
         "full_name": "Animal Welfare Board of India",
         "hindi_name": "भारतीय पशु कल्याण बोर्ड",
@@ -101,6 +104,15 @@ INDIA_AGENCIES: dict[str, dict[str, str]] = {
     },
 }
 
+INDIA_AGENCIES = freeze_registry(
+    INDIA_AGENCIES,
+    defaults={
+        "pio_designation": "Public Information Officer",
+        "hindi_name": "",
+        "parent_ministry": "",
+    },
+)
+
 
 # ---------------------------------------------------------------------------
 # RTI application template — bilingual English / Hindi
@@ -132,12 +144,12 @@ following information:
 
 {% if keywords %}
 The above request specifically concerns the following subjects: \
-{{ keywords | join(', ') }}.
+{{ keywords_str }}.
 {% endif %}
 
 {% if facilities %}
 This request relates to the following establishments/facilities: \
-{{ facilities | join('; ') }}.
+{{ facilities_str }}.
 {% endif %}
 
 PERIOD: {{ date_range }}.
@@ -184,10 +196,18 @@ Additional remarks: {{ additional_notes }}
 Yours faithfully,
 
 {{ requester_name }}
-{% if requester_org %}Organization: {{ requester_org }}{% endif %}
-{% if requester_address %}Address: {{ requester_address }}{% endif %}
-{% if requester_email %}Email: {{ requester_email }}{% endif %}
-{% if requester_phone %}Phone: {{ requester_phone }}{% endif %}
+{%- if requester_org +%}
+Organization: {{ requester_org }}
+{%- endif %}
+{%- if requester_address +%}
+Address: {{ requester_address }}
+{%- endif %}
+{%- if requester_email +%}
+Email: {{ requester_email }}
+{%- endif %}
+{%- if requester_phone +%}
+Phone: {{ requester_phone }}
+{%- endif %}
 """
 
 RTI_TEMPLATE_HINDI = """\
@@ -216,7 +236,7 @@ RTI_TEMPLATE_HINDI = """\
 
 {% if keywords %}
 उपरोक्त अनुरोध विशेष रूप से निम्नलिखित विषयों से संबंधित है: \
-{{ keywords | join(', ') }}.
+{{ keywords_str }}.
 {% endif %}
 
 अवधि: {{ date_range }}.
@@ -231,12 +251,35 @@ RTI_TEMPLATE_HINDI = """\
 भवदीय,
 
 {{ requester_name }}
-{% if requester_org %}संस्था: {{ requester_org }}{% endif %}
-{% if requester_address %}पता: {{ requester_address }}{% endif %}
-{% if requester_email %}ईमेल: {{ requester_email }}{% endif %}
-{% if requester_phone %}दूरभाष: {{ requester_phone }}{% endif %}
+{%- if requester_org +%}
+संस्था: {{ requester_org }}
+{%- endif %}
+{%- if requester_address +%}
+पता: {{ requester_address }}
+{%- endif %}
+{%- if requester_email +%}
+ईमेल: {{ requester_email }}
+{%- endif %}
+{%- if requester_phone +%}
+दूरभाष: {{ requester_phone }}
+{%- endif %}
 """
 
+_ENGLISH_TEMPLATE = register_template("india_rti_english", RTI_TEMPLATE_ENGLISH)
+_HINDI_TEMPLATE = register_template("india_rti_hindi", RTI_TEMPLATE_HINDI)
+
+_INDIA_LEGAL_BASIS = "Right to Information Act, 2005, Section 6(1)"
+_INDIA_FILING_METHOD = (
+    "Post / hand delivery / RTI Online Portal "
+    "(https://rtionline.gov.in) for central government bodies"
+)
+_INDIA_FEE_NOTES = (
+    "Application fee: Rs. 10/- via IPO, DD, court fee stamp, or "
+    "online payment. BPL applicants are exempt (Section 7(5)). "
+    "Additional fees for copies: Rs. 2/- per A4 page, Rs. 50/- per "
+    "diskette/CD (as per RTI Fee Rules, 2005)."
+)
+
 
 class IndiaRTIGenerator(RequestGenerator):
     """Generate RTI applications under the Right to Information Act, 2005."""
@@ -264,20 +307,16 @@ class IndiaRTIGenerator(RequestGenerator):
             tpl = self.get_template(context.template_id)
             if tpl:
                 template_description = tpl.get("description", "")
-                context.specific_records = (
-                    tpl.get("records", []) + context.specific_records
-                )
-                if not context.keywords and tpl.get("keywords"):
-                    context.keywords = tpl["keywords"]
+                context = context.merged_with_template(tpl)
 
-        tpl_str = RTI_TEMPLATE_HINDI if language.lower() == "hindi" else RTI_TEMPLATE_ENGLISH
+        tpl_name = _HINDI_TEMPLATE if language.lower() == "hindi" else _ENGLISH_TEMPLATE
 
         text = self._render(
-            tpl_str,
+            tpl_name,
             context,
-            pio_designation=agency_info.get("pio_designation", "Public Information Officer"),
+            pio_designation=agency_info["pio_designation"],
             agency_full_name=agency_info["full_name"],
-            agency_hindi_name=agency_info.get("hindi_name", ""),
+            agency_hindi_name=agency_info["hindi_name"],
             agency_address=agency_info["address"],
             fee_mode=fee_mode,
             bpl=bpl,
@@ -285,30 +324,22 @@ class IndiaRTIGenerator(RequestGenerator):
         )
 
         return GeneratedRequest(
-            text=text.strip(),
+            text=text,
             jurisdiction="India",
             agency=agency_info["full_name"],
-            legal_basis="Right to Information Act, 2005, Section 6(1)",
+            legal_basis=_INDIA_LEGAL_BASIS,
             estimated_deadline_days=30,
-            filing_method=(
-                "Post / hand delivery / RTI Online Portal "
-                "(https://rtionline.gov.in) for central government bodies"
-            ),
-            fee_notes=(
-                "Application fee: Rs. 10/- via IPO, DD, court fee stamp, or "
-                "online payment. BPL applicants are exempt (Section 7(5)). "
-                "Additional fees for copies: Rs. 2/- per A4 page, Rs. 50/- per "
-                "diskette/CD (as per RTI Fee Rules, 2005)."
-            ),
+            filing_method=_INDIA_FILING_METHOD,
+            fee_notes=_INDIA_FEE_NOTES,
             context=context,
             metadata={
                 "agency_key": agency_key,
                 "language": language,
-                "parent_ministry": agency_info.get("parent_ministry", ""),
+                "parent_ministry": agency_info["parent_ministry"],
             },
         )
 
-    def get_agencies(self) -> dict[str, dict[str, str]]:
+    def get_agencies(self) -> Mapping[str, Mapping[str, str]]:
         return INDIA_AGENCIES
 
     def get_legal_basis(self) -> str:
@@ -356,6 +387,8 @@ class IndiaRTIGenerator(RequestGenerator):
 
     @staticmethod
     def _resolve_agency(raw: str) -> str:
+        if raw in INDIA_AGENCIES:
+            return raw
         upper = raw.upper().strip()
         if upper in INDIA_AGENCIES:
             return upper
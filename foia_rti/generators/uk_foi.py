@@ -8,16 +8,19 @@ UK public authorities involved in animal agriculture and food safety.
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from typing import Any, Optional
 
 from foia_rti.generators.generator_base import (
     GeneratedRequest,
     RequestContext,
     RequestGenerator,
+    freeze_registry,
+    register_template,
 )
 
 
-UK_AGENCIES: dict[str, dict[str, str]] = {
+UK_AGENCIES: Mapping[str, Mapping[str, str]] = {
     "DEFRA": {
         "full_name": "Department for Environment, Food and Rural Affairs",
         "foi_email": "defra.foi@defra.gov.uk",
@@ -79,6 +82,8 @@ UK_AGENCIES: dict[str, dict[str, str]] = {
     },
 }
 
+UK_AGENCIES = freeze_registry(UK_AGENCIES, defaults={"foi_email": "", "address": ""})
+
 
 UK_FOI_TEMPLATE = """\
 {{ filing_date }}
@@ -110,12 +115,12 @@ I request the following information:
 
 {% if keywords %}
 Specifically, I request information relating to the following subjects: \
-{{ keywords | join(', ') }}.
+{{ keywords_str }}.
 {% endif %}
 
 {% if facilities %}
 This request relates to the following establishments or locations: \
-{{ facilities | join('; ') }}.
+{{ facilities_str }}.
 {% endif %}
 
 TIME PERIOD: {{ date_range }}.
@@ -149,12 +154,37 @@ I look forward to your response within the statutory time frame.
 Yours faithfully,
 
 {{ requester_name }}
-{% if requester_org %}{{ requester_org }}{% endif %}
-{% if requester_address %}{{ requester_address }}{% endif %}
-{% if requester_email %}{{ requester_email }}{% endif %}
-{% if requester_phone %}{{ requester_phone }}{% endif %}
+{%- if requester_org +%}
+{{ requester_org }}
+{%- endif %}
+{%- if requester_address +%}
+{{ requester_address }}
+{%- endif %}
+{%- if requester_email +%}
+{{ requester_email }}
+{%- endif %}
+{%- if requester_phone +%}
+{{ requester_phone }}
+{%- endif %}
 """
 
+_FOI_TEMPLATE = register_template("uk_foi", UK_FOI_TEMPLATE)
+
+_UK_LEGAL_BASIS = (
+    "Freedom of Information Act 2000, Section 1; "
+    "Environmental Information Regulations 2004 (if applicable)"
+)
+_UK_FILING_METHOD = "email"
+_UK_FEE_NOTES = (
+    "No application fee for FOI requests. If estimated cost exceeds "
+    "the 'appropriate limit' (currently GBP 600 for central government, "
+    "GBP 450 for other authorities — Freedom of Information and Data "
+    "Protection (Appropriate Limit and Fees) Regulations 2004), the "
+    "authority may refuse or charge. Disbursement costs (printing, "
+    "postage) may be charged at cost. EIR requests cannot be refused "
+    "on cost grounds alone — must balance public interest."
+)
+
 
 class UKFOIGenerator(RequestGenerator):
     """Generate FOI requests under the UK Freedom of Information Act 2000."""
@@ -172,42 +202,31 @@ class UKFOIGenerator(RequestGenerator):
             )
 
         text = self._render(
-            UK_FOI_TEMPLATE,
+            _FOI_TEMPLATE,
             context,
             agency_full_name=agency_info["full_name"],
-            agency_address=agency_info.get("address", ""),
-            agency_email=agency_info.get("foi_email", ""),
+            agency_address=agency_info["address"],
+            agency_email=agency_info["foi_email"],
             eir=eir,
         )
 
         return GeneratedRequest(
-            text=text.strip(),
+            text=text,
             jurisdiction="UK",
             agency=agency_info["full_name"],
-            legal_basis=(
-                "Freedom of Information Act 2000, Section 1; "
-                "Environmental Information Regulations 2004 (if applicable)"
-            ),
+            legal_basis=_UK_LEGAL_BASIS,
             estimated_deadline_days=20,
-            filing_method="email",
-            fee_notes=(
-                "No application fee for FOI requests. If estimated cost exceeds "
-                "the 'appropriate limit' (currently GBP 600 for central government, "
-                "GBP 450 for other authorities — Freedom of Information and Data "
-                "Protection (Appropriate Limit and Fees) Regulations 2004), the "
-                "authority may refuse or charge. Disbursement costs (printing, "
-                "postage) may be charged at cost. EIR requests cannot be refused "
-                "on cost grounds alone — must balance public interest."
-            ),
+            filing_method=_UK_FILING_METHOD,
+            fee_notes=_UK_FEE_NOTES,
             context=context,
             metadata={
                 "agency_key": agency_key,
-                "agency_email": agency_info.get("foi_email", ""),
+                "agency_email": agency_info["foi_email"],
                 "eir_included": eir,
             },
         )
 
-    def get_agencies(self) -> dict[str, dict[str, str]]:
+    def get_agencies(self) -> Mapping[str, Mapping[str, str]]:
         return UK_AGENCIES
 
     def get_legal_basis(self) -> str:
@@ -253,6 +272,8 @@ class UKFOIGenerator(RequestGenerator):
 
     @staticmethod
     def _resolve_agency(raw: str) -> str:
+        if raw in UK_AGENCIES:
+            return raw
         upper = raw.upper().strip()
         if upper in UK_AGENCIES:
             return upper
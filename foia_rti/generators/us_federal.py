@@ -8,12 +8,23 @@ USDA, EPA, FDA, OSHA, and others.
 
 from __future__ import annotations
 
+import re
+import sys
+from bisect import bisect_right
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import accumulate
+from types import MappingProxyType
 from typing import Any, Optional
 
 from foia_rti.generators.generator_base import (
     GeneratedRequest,
     RequestContext,
     RequestGenerator,
+    compile_template,
+    freeze_registry,
+    register_template,
 )
 
 
@@ -21,7 +32,7 @@ from foia_rti.generators.generator_base import (
 # Agency registry — real FOIA contacts and submission info
 # ---------------------------------------------------------------------------
 
-US_FEDERAL_AGENCIES: dict[str, dict[str, str]] = {
+US_FEDERAL_AGENCIES: Mapping[str, Mapping[str, str]] = {
     "USDA-APHIS": {
         "full_name": "United States Department of Agriculture — "
                      "Animal and Plant Health Inspection Service",
@@ -101,14 +112,84 @@ US_FEDERAL_AGENCIES: dict[str, dict[str, str]] = {
     },
 }
 
+US_FEDERAL_AGENCIES = freeze_registry(
+    US_FEDERAL_AGENCIES, defaults={"email": "", "portal": "", "phone": ""}
+)
+
+# Common aliases for agency keys
+_AGENCY_ALIASES: dict[str, str] = {
+    "USDA": "USDA-APHIS",
+    "APHIS": "USDA-APHIS",
+    "FSIS": "USDA-FSIS",
+    "AMS": "USDA-AMS",
+    "FSA": "USDA-FSA",
+    "NRCS": "USDA-NRCS",
+}
+
+
+def _build_agency_key_index() -> dict[str, str]:
+    """
+    Exact-match index of canonical keys, then aliases, then the component
+    after the department prefix (e.g. "APHIS" for "USDA-APHIS").
+    """
+    index = {key: key for key in US_FEDERAL_AGENCIES}
+    for alias, key in _AGENCY_ALIASES.items():
+        index.setdefault(alias, key)
+    for key in US_FEDERAL_AGENCIES:
+        index.setdefault(key.rpartition("-")[2], key)
+    return index
+
+
+_AGENCY_KEY_INDEX = _build_agency_key_index()
+
+# Substring fallbacks for input the index does not know. The pattern finds
+# the leftmost (longest) agency key within the input. The NUL-joined key
+# string finds the first key, in registry order, that contains the input.
+_AGENCY_KEYS: tuple[str, ...] = tuple(US_FEDERAL_AGENCIES)
+_AGENCY_KEY_PATTERN = re.compile(
+    "|".join(re.escape(key) for key in sorted(_AGENCY_KEYS, key=len, reverse=True))
+)
+_AGENCY_KEYS_JOINED = "\0".join(_AGENCY_KEYS)
+_AGENCY_KEY_OFFSETS: tuple[int, ...] = tuple(
+    accumulate((len(key) + 1 for key in _AGENCY_KEYS[:-1]), initial=0)
+)
+
+
+@dataclass(frozen=True, slots=True)
+class AgencyInfo:
+    """Attribute view of one US_FEDERAL_AGENCIES entry."""
+
+    full_name: str
+    foia_officer: str
+    address: str
+    email: str
+    portal: str
+    phone: str
+    notes: str
+
+
+_AGENCY_INFO: dict[str, AgencyInfo] = {
+    key: AgencyInfo(**info) for key, info in US_FEDERAL_AGENCIES.items()
+}
+
+_AGENCY_FILING_METHOD: dict[str, str] = {
+    key: "online portal preferred; email accepted" if info.portal else "email"
+    for key, info in _AGENCY_INFO.items()
+}
+
+_AGENCY_METADATA: dict[str, dict[str, str]] = {
+    key: {"agency_key": key, "agency_email": info.email, "agency_portal": info.portal}
+    for key, info in _AGENCY_INFO.items()
+}
+
 
 # ---------------------------------------------------------------------------
 # Jinja2 master template
 # ---------------------------------------------------------------------------
 
-FOIA_REQUEST_TEMPLATE = """\
-{{ filing_date }}
-
+# Agency address block and opening paragraph. These depend only on the
+# agency, so each agency's header is rendered once and reused.
+AGENCY_HEADER_TEMPLATE = """\
 {{ agency_info.foia_officer }}
 {{ agency_info.full_name }}
 {{ agency_info.address }}
@@ -122,7 +203,12 @@ Dear FOIA Officer:
 Pursuant to the Freedom of Information Act (FOIA), 5 U.S.C. § 552, \
 and the implementing regulations of the {{ agency_info.full_name }}, \
 I respectfully request copies of the following records:
+"""
+
+FOIA_REQUEST_TEMPLATE = """\
+{{ filing_date }}
 
+{{ agency_header }}
 {% if template_description %}
 {{ template_description }}
 {% endif %}
@@ -133,12 +219,12 @@ I respectfully request copies of the following records:
 
 {% if keywords %}
 Specifically, I request records containing or relating to the following \
-terms: {{ keywords | join(', ') }}.
+terms: {{ keywords_str }}.
 {% endif %}
 
 {% if facilities %}
 This request pertains to the following facilities or entities: \
-{{ facilities | join('; ') }}.
+{{ facilities_str }}.
 {% endif %}
 
 DATE RANGE: {{ date_range }}.
@@ -201,12 +287,62 @@ any questions regarding this request, please contact me at the address below.
 Sincerely,
 
 {{ requester_name }}
-{% if requester_org %}{{ requester_org }}{% endif %}
-{% if requester_address %}{{ requester_address }}{% endif %}
-{% if requester_email %}{{ requester_email }}{% endif %}
-{% if requester_phone %}{{ requester_phone }}{% endif %}
+{%- if requester_org +%}
+{{ requester_org }}
+{%- endif %}
+{%- if requester_address +%}
+{{ requester_address }}
+{%- endif %}
+{%- if requester_email +%}
+{{ requester_email }}
+{%- endif %}
+{%- if requester_phone +%}
+{{ requester_phone }}
+{%- endif %}
 """
 
+_HEADER_TEMPLATE = register_template("us_federal_header", AGENCY_HEADER_TEMPLATE)
+_FOIA_TEMPLATE = register_template("us_federal", FOIA_REQUEST_TEMPLATE)
+
+
+_JURISDICTION = sys.intern("US-Federal")
+_LEGAL_BASIS = "Freedom of Information Act, 5 U.S.C. § 552"
+_FEE_NOTES = (
+    "Fee waiver requested under 5 U.S.C. § 552(a)(4)(A)(iii). "
+    "Fallback: $25 cap unless requester contacted."
+)
+
+_LEGAL_BASIS_SUMMARY = (
+    "Freedom of Information Act (FOIA), 5 U.S.C. § 552, as amended. "
+    "Enacted 1966; major amendments in 1974, 1996 (E-FOIA), "
+    "2007 (OPEN Government Act), and 2016 (FOIA Improvement Act)."
+)
+
+_APPEAL_INFO: Mapping[str, str] = MappingProxyType({
+    "basis": (
+        "Under 5 U.S.C. § 552(a)(6)(A), a requester may appeal any adverse "
+        "determination to the head of the agency within 90 days (or as "
+        "specified by the agency's regulations)."
+    ),
+    "next_step": (
+        "If the administrative appeal is denied, the requester may seek "
+        "judicial review by filing suit in the US District Court under "
+        "5 U.S.C. § 552(a)(4)(B)."
+    ),
+    "ogis": (
+        "The Office of Government Information Services (OGIS) within the "
+        "National Archives offers free mediation services as a non-exclusive "
+        "alternative to litigation. Contact: ogis@nara.gov, (202) 741-5770."
+    ),
+})
+
+
+@lru_cache(maxsize=None)
+def _agency_header(agency_key: str) -> str:
+    return compile_template(_HEADER_TEMPLATE).render(
+        agency_info=_AGENCY_INFO[agency_key]
+    )
+
 
 class USFederalGenerator(RequestGenerator):
     """Generate FOIA requests for US federal agencies."""
@@ -217,67 +353,76 @@ class USFederalGenerator(RequestGenerator):
     # ---- public interface ----
 
     def generate(self, context: RequestContext) -> GeneratedRequest:
-        agency_key = self._resolve_agency_key(context.agency)
-        agency_info = US_FEDERAL_AGENCIES.get(agency_key)
-        if agency_info is None:
-            raise ValueError(
-                f"Unknown agency '{context.agency}'. Known agencies: "
-                f"{', '.join(US_FEDERAL_AGENCIES.keys())}"
-            )
+        agency_key = self._known_agency_key(context.agency)
+        tpl = self.get_template(context.template_id) if context.template_id else None
+        return self._generate(context, agency_key, tpl)
+
+    def generate_many(
+        self, contexts: Iterable[RequestContext], **kwargs: Any
+    ) -> Iterator[GeneratedRequest]:
+        """
+        Lazily generate one request per context, in input order.
+
+        Each distinct agency string and template ID is resolved once per
+        batch rather than once per context. Keyword arguments are passed
+        through to generate() for every context, as in the base class.
+        """
+        if kwargs:
+            yield from super().generate_many(contexts, **kwargs)
+            return
+        agency_keys: dict[str, str] = {}
+        templates: dict[str, Optional[dict[str, Any]]] = {}
+        for context in contexts:
+            agency_key = agency_keys.get(context.agency)
+            if agency_key is None:
+                agency_key = agency_keys[context.agency] = self._known_agency_key(context.agency)
+            tpl = None
+            if context.template_id:
+                if context.template_id not in templates:
+                    templates[context.template_id] = self.get_template(context.template_id)
+                tpl = templates[context.template_id]
+            yield self._generate(context, agency_key, tpl)
+
+    def _generate(
+        self,
+        context: RequestContext,
+        agency_key: str,
+        tpl: Optional[dict[str, Any]],
+    ) -> GeneratedRequest:
+        agency_info = _AGENCY_INFO[agency_key]
 
         template_description = ""
-        if context.template_id:
-            tpl = self.get_template(context.template_id)
-            if tpl:
-                template_description = tpl.get("description", "")
-                # Merge template-specified records with any user-provided ones
-                context.specific_records = (
-                    tpl.get("records", []) + context.specific_records
-                )
-                if not context.keywords and tpl.get("keywords"):
-                    context.keywords = tpl["keywords"]
+        if tpl:
+            template_description = tpl.get("description", "")
+            # Merge template-specified records with any user-provided ones
+            context = context.merged_with_template(tpl)
 
         text = self._render(
-            FOIA_REQUEST_TEMPLATE,
+            _FOIA_TEMPLATE,
             context,
-            agency_info=agency_info,
+            agency_header=_agency_header(agency_key),
             template_description=template_description,
             fee_waiver=context.fee_waiver,
             expedited=context.expedited_processing,
         )
 
-        filing_method = "email"
-        if agency_info.get("portal"):
-            filing_method = "online portal preferred; email accepted"
-
         return GeneratedRequest(
-            text=text.strip(),
-            jurisdiction="US-Federal",
-            agency=agency_info["full_name"],
-            legal_basis="Freedom of Information Act, 5 U.S.C. § 552",
+            text=text,
+            jurisdiction=_JURISDICTION,
+            agency=agency_info.full_name,
+            legal_basis=_LEGAL_BASIS,
             estimated_deadline_days=20,
-            filing_method=filing_method,
-            fee_notes=(
-                "Fee waiver requested under 5 U.S.C. § 552(a)(4)(A)(iii). "
-                "Fallback: $25 cap unless requester contacted."
-            ),
+            filing_method=_AGENCY_FILING_METHOD[agency_key],
+            fee_notes=_FEE_NOTES,
             context=context,
-            metadata={
-                "agency_key": agency_key,
-                "agency_email": agency_info.get("email", ""),
-                "agency_portal": agency_info.get("portal", ""),
-            },
+            metadata=dict(_AGENCY_METADATA[agency_key]),
         )
 
-    def get_agencies(self) -> dict[str, dict[str, str]]:
+    def get_agencies(self) -> Mapping[str, Mapping[str, str]]:
         return US_FEDERAL_AGENCIES
 
     def get_legal_basis(self) -> str:
-        return (
-            "Freedom of Information Act (FOIA), 5 U.S.C. § 552, as amended. "
-            "Enacted 1966; major amendments in 1974, 1996 (E-FOIA), "
-            "2007 (OPEN Government Act), and 2016 (FOIA Improvement Act)."
-        )
+        return _LEGAL_BASIS_SUMMARY
 
     def get_fee_waiver_language(self, context: RequestContext) -> str:
         return (
@@ -289,46 +434,38 @@ class USFederalGenerator(RequestGenerator):
             "transparency in animal agriculture policy."
         )
 
-    def get_appeal_info(self) -> dict[str, str]:
-        return {
-            "basis": (
-                "Under 5 U.S.C. § 552(a)(6)(A), a requester may appeal any adverse "
-                "determination to the head of the agency within 90 days (or as "
-                "specified by the agency's regulations)."
-            ),
-            "next_step": (
-                "If the administrative appeal is denied, the requester may seek "
-                "judicial review by filing suit in the US District Court under "
-                "5 U.S.C. § 552(a)(4)(B)."
-            ),
-            "ogis": (
-                "The Office of Government Information Services (OGIS) within the "
-                "National Archives offers free mediation services as a non-exclusive "
-                "alternative to litigation. Contact: ogis@nara.gov, (202) 741-5770."
-            ),
-        }
+    def get_appeal_info(self) -> Mapping[str, str]:
+        return _APPEAL_INFO
 
     # ---- internals ----
 
+    def _known_agency_key(self, raw: str) -> str:
+        """Resolve user input to an agency key, raising ValueError if unknown."""
+        agency_key = self._resolve_agency_key(raw)
+        if agency_key not in _AGENCY_INFO:
+            raise ValueError(
+                f"Unknown agency '{raw}'. Known agencies: "
+                f"{', '.join(US_FEDERAL_AGENCIES.keys())}"
+            )
+        return agency_key
+
     def _resolve_agency_key(self, raw: str) -> str:
         """Fuzzy-match user input to a canonical agency key."""
+        # Index keys are upper-case and stripped, so input already in that
+        # form resolves without normalising it first.
+        key = _AGENCY_KEY_INDEX.get(raw)
+        if key is not None:
+            return key
         upper = raw.upper().strip()
-        # Direct match
-        if upper in US_FEDERAL_AGENCIES:
-            return upper
-        # Common aliases
-        aliases: dict[str, str] = {
-            "USDA": "USDA-APHIS",
-            "APHIS": "USDA-APHIS",
-            "FSIS": "USDA-FSIS",
-            "AMS": "USDA-AMS",
-            "FSA": "USDA-FSA",
-            "NRCS": "USDA-NRCS",
-        }
-        if upper in aliases:
-            return aliases[upper]
-        # Substring search
-        for key in US_FEDERAL_AGENCIES:
-            if upper in key or key in upper:
-                return key
+        key = _AGENCY_KEY_INDEX.get(upper)
+        if key is not None:
+            return key
+        # An agency key mentioned anywhere in the input
+        match = _AGENCY_KEY_PATTERN.search(upper)
+        if match:
+            return match.group(0)
+        # Input that is a fragment of an agency key
+        pos = _AGENCY_KEYS_JOINED.find(upper)
+        if pos >= 0:
+            return _AGENCY_KEYS[bisect_right(_AGENCY_KEY_OFFSETS, pos) - 1]
         return raw
@@ -8,17 +8,24 @@ ten largest animal agriculture states by livestock inventory.
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any, Optional
 
 from foia_rti.generators.generator_base import (
     GeneratedRequest,
     RequestContext,
     RequestGenerator,
+    compile_template,
+    context_values,
+    freeze_registry,
+    register_template,
 )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class StateInfo:
     """Legal and procedural details for a single state's public records law."""
 
@@ -30,9 +37,12 @@ class StateInfo:
     response_type: str  # "calendar" or "business"
     fee_notes: str
     appeal_body: str
-    key_agencies: dict[str, dict[str, str]]
+    key_agencies: Mapping[str, Mapping[str, str]]
     notes: str = ""
 
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "key_agencies", freeze_registry(self.key_agencies))
+
 
 # ---------------------------------------------------------------------------
 # State registry — real statutes for major animal-agriculture states
@@ -330,6 +340,42 @@ STATE_REGISTRY: dict[str, StateInfo] = {
 }
 
 
+def _build_agency_index() -> dict[str, dict[str, Mapping[str, str]]]:
+    """
+    Per-state exact-match index of uppercased agency keys, then uppercased
+    full names.
+    """
+    index: dict[str, dict[str, Mapping[str, str]]] = {}
+    for abbr, info in STATE_REGISTRY.items():
+        entries = {name.upper(): details for name, details in info.key_agencies.items()}
+        for details in info.key_agencies.values():
+            if details.get("full_name"):
+                entries.setdefault(details["full_name"].upper(), details)
+        index[abbr] = entries
+    return index
+
+
+_NAME_TO_ABBR = {info.state.upper(): abbr for abbr, info in STATE_REGISTRY.items()}
+_AGENCY_INDEX = _build_agency_index()
+
+
+def _normalize_key(raw: str) -> str:
+    return raw.upper().strip()
+
+
+@lru_cache(maxsize=512)
+def _match_agency(state_abbr: str, upper: str) -> Optional[Mapping[str, str]]:
+    details = _AGENCY_INDEX[state_abbr].get(upper)
+    if details is not None:
+        return details
+    agencies = STATE_REGISTRY[state_abbr].key_agencies
+    for name, details in agencies.items():
+        if upper in name.upper() or name.upper() in upper:
+            return details
+    # Return what we have even if no exact match
+    return next(iter(agencies.values()), None)
+
+
 # ---------------------------------------------------------------------------
 # Jinja2 template for state-level requests
 # ---------------------------------------------------------------------------
@@ -405,12 +451,70 @@ any questions.
 Sincerely,
 
 {{ requester_name }}
-{% if requester_org %}{{ requester_org }}{% endif %}
-{% if requester_address %}{{ requester_address }}{% endif %}
-{% if requester_email %}{{ requester_email }}{% endif %}
-{% if requester_phone %}{{ requester_phone }}{% endif %}
+{%- if requester_org +%}
+{{ requester_org }}
+{%- endif %}
+{%- if requester_address +%}
+{{ requester_address }}
+{%- endif %}
+{%- if requester_email +%}
+{{ requester_email }}
+{%- endif %}
+{%- if requester_phone +%}
+{{ requester_phone }}
+{%- endif %}
 """
 
+_STATE_TEMPLATE = register_template("us_state", STATE_REQUEST_TEMPLATE)
+
+_SORTED_STATES: tuple[tuple[str, StateInfo], ...] = tuple(sorted(STATE_REGISTRY.items()))
+_SUPPORTED_STATES: tuple[str, ...] = tuple(abbr for abbr, _ in _SORTED_STATES)
+
+_STATE_AGENCIES: Mapping[str, Mapping[str, str]] = MappingProxyType({
+    f"{abbr} — {name}": details
+    for abbr, info in STATE_REGISTRY.items()
+    for name, details in info.key_agencies.items()
+})
+
+_LEGAL_BASIS_SUMMARY = "State public records laws:\n" + "\n".join(
+    f"  {info.state} ({abbr}): {info.statute_name}, {info.statute_citation}"
+    for abbr, info in _SORTED_STATES
+)
+
+_APPEAL_INFO: Mapping[str, str] = MappingProxyType({
+    "overview": (
+        "Appeals vary by state. Most allow either administrative appeal or direct court action."
+    ),
+    "by_state": "\n".join(
+        f"  {info.state}: {info.appeal_body}" for abbr, info in _SORTED_STATES
+    ),
+})
+
+
+@lru_cache(maxsize=256)
+def _render_state(
+    state_abbr: str,
+    agency_full_name: str,
+    agency_address: str,
+    agency_email: str,
+    fee_waiver: bool,
+    values: tuple[tuple[str, Any], ...],
+) -> str:
+    """Render a state request; repeat (state, agency, context) inputs hit the cache."""
+    state_info = STATE_REGISTRY[state_abbr]
+    return compile_template(_STATE_TEMPLATE).render(
+        dict(values),
+        statute_name=state_info.statute_name,
+        statute_citation=state_info.statute_citation,
+        response_days=state_info.response_days,
+        response_type=state_info.response_type,
+        agency_full_name=agency_full_name,
+        agency_address=agency_address,
+        agency_email=agency_email,
+        state_notes=state_info.notes,
+        fee_waiver=fee_waiver,
+    )
+
 
 class USStateGenerator(RequestGenerator):
     """Generate public records requests for US state agencies."""
@@ -429,22 +533,17 @@ class USStateGenerator(RequestGenerator):
 
         agency_data = self._resolve_agency(context.agency, state_info)
 
-        text = self._render(
-            STATE_REQUEST_TEMPLATE,
-            context,
-            statute_name=state_info.statute_name,
-            statute_citation=state_info.statute_citation,
-            response_days=state_info.response_days,
-            response_type=state_info.response_type,
-            agency_full_name=agency_data.get("full_name", context.agency),
-            agency_address=agency_data.get("address", ""),
-            agency_email=agency_data.get("email", ""),
-            state_notes=state_info.notes,
-            fee_waiver=context.fee_waiver,
+        text = _render_state(
+            state_abbr,
+            agency_data.get("full_name", context.agency),
+            agency_data.get("address", ""),
+            agency_data.get("email", ""),
+            context.fee_waiver,
+            context_values(_STATE_TEMPLATE, context),
         )
 
         return GeneratedRequest(
-            text=text.strip(),
+            text=text,
             jurisdiction=f"US-State-{state_abbr}",
             agency=agency_data.get("full_name", context.agency),
             legal_basis=f"{state_info.statute_name}, {state_info.statute_citation}",
@@ -459,18 +558,11 @@ class USStateGenerator(RequestGenerator):
             },
         )
 
-    def get_agencies(self) -> dict[str, dict[str, str]]:
-        result: dict[str, dict[str, str]] = {}
-        for abbr, info in STATE_REGISTRY.items():
-            for name, details in info.key_agencies.items():
-                result[f"{abbr} — {name}"] = details
-        return result
+    def get_agencies(self) -> Mapping[str, Mapping[str, str]]:
+        return _STATE_AGENCIES
 
     def get_legal_basis(self) -> str:
-        lines = []
-        for abbr, info in sorted(STATE_REGISTRY.items()):
-            lines.append(f"  {info.state} ({abbr}): {info.statute_name}, {info.statute_citation}")
-        return "State public records laws:\n" + "\n".join(lines)
+        return _LEGAL_BASIS_SUMMARY
 
     def get_fee_waiver_language(self, context: RequestContext) -> str:
         return (
@@ -478,40 +570,25 @@ class USStateGenerator(RequestGenerator):
             "in the public interest for educational and nonprofit purposes."
         )
 
-    def get_appeal_info(self) -> dict[str, str]:
-        lines = []
-        for abbr, info in sorted(STATE_REGISTRY.items()):
-            lines.append(f"  {info.state}: {info.appeal_body}")
-        return {
-            "overview": "Appeals vary by state. Most allow either administrative appeal or direct court action.",
-            "by_state": "\n".join(lines),
-        }
+    def get_appeal_info(self) -> Mapping[str, str]:
+        return _APPEAL_INFO
 
     def get_supported_states(self) -> list[str]:
-        return sorted(STATE_REGISTRY.keys())
+        return list(_SUPPORTED_STATES)
 
     # ---- internals ----
 
     @staticmethod
     def _resolve_state(raw: str) -> str:
         """Normalize state input to two-letter abbreviation."""
-        upper = raw.upper().strip().replace("US-STATE-", "")
+        upper = _normalize_key(raw).replace("US-STATE-", "")
         if upper in STATE_REGISTRY:
             return upper
-        # Try full name match
-        for abbr, info in STATE_REGISTRY.items():
-            if info.state.upper() == upper:
-                return abbr
-        return upper
+        return _NAME_TO_ABBR.get(upper, upper)
 
     @staticmethod
-    def _resolve_agency(raw: str, state_info: StateInfo) -> dict[str, str]:
-        upper = raw.upper().strip()
-        for name, details in state_info.key_agencies.items():
-            if upper in name.upper() or name.upper() in upper:
-                return details
-        # Return what we have even if no exact match
-        if state_info.key_agencies:
-            first_key = next(iter(state_info.key_agencies))
-            return state_info.key_agencies[first_key]
-        return {"full_name": raw}
+    def _resolve_agency(raw: str, state_info: StateInfo) -> Mapping[str, str]:
+        details = _match_agency(state_info.abbreviation, _normalize_key(raw))
+        if details is None:
+            return {"full_name": raw}
+        return details
@@ -8,7 +8,7 @@ from foia_rti.tracker.tracker import (
     RequestStatus,
     TrackerDB,
 )
-from foia_rti.tracker.deadlines import DeadlineCalculator
+from foia_rti.tracker.deadlines import DeadlineCalculator, compute_deadline
 from foia_rti.tracker.alerts import AlertEngine
 from foia_rti.tracker.appeals import AppealGenerator
 
@@ -18,6 +18,7 @@ __all__ = [
     "RequestStatus",
     "TrackerDB",
     "DeadlineCalculator",
+    "compute_deadline",
     "AlertEngine",
     "AppealGenerator",
 ]
@@ -7,23 +7,109 @@ email, Telegram, CLI, or any notification system.
 
 from __future__ import annotations
 
+import time
+from bisect import bisect_left
+from collections.abc import Iterable, Set as AbstractSet
 from dataclasses import dataclass
 from datetime import date, timedelta
 from enum import Enum
+from operator import attrgetter
 from typing import Optional
 
 from foia_rti.tracker.tracker import FOIARequest, RequestStatus, TrackerDB
 from foia_rti.tracker.deadlines import DeadlineCalculator
 
 
+# Statuses that still await an agency response and so can generate alerts
+_ACTIVE_STATUSES: tuple[RequestStatus, ...] = (
+    RequestStatus.FILED,
+    RequestStatus.ACKNOWLEDGED,
+    RequestStatus.PROCESSING,
+    RequestStatus.EXTENDED,
+    RequestStatus.APPEALED,
+)
+
+
 class AlertSeverity(Enum):
-    INFO = "info"
-    WARNING = "warning"
-    URGENT = "urgent"
-    OVERDUE = "overdue"
+    # (value, order): order ranks alerts most severe first
+    order: int
+
+    INFO = ("info", 3)
+    WARNING = ("warning", 2)
+    URGENT = ("urgent", 1)
+    OVERDUE = ("overdue", 0)
+
+    def __new__(cls, value: str, order: int) -> AlertSeverity:
+        member = object.__new__(cls)
+        member._value_ = value
+        member.order = order
+        return member
+
+
+_UPCOMING = frozenset({AlertSeverity.URGENT, AlertSeverity.WARNING, AlertSeverity.INFO})
+
+_SORT_KEY = attrgetter("severity.order", "days_remaining")
+
+_ALERT_KEYS: tuple[str, ...] = (
+    "request_id",
+    "agency",
+    "jurisdiction",
+    "topic",
+    "severity",
+    "message",
+    "days_remaining",
+    "deadline",
+    "suggested_action",
+)
+
+# Text prefixes indexed by AlertSeverity.order
+_SEVERITY_PREFIXES: tuple[str, ...] = tuple(
+    f"[{severity.name}]" for severity in sorted(AlertSeverity, key=attrgetter("order"))
+)
+
+_OVERDUE_ACTIONS: dict[str, str] = {
+    "US-Federal": (
+        "Send a follow-up letter citing 5 U.S.C. Section 552(a)(6)(A). "
+        "Consider filing an administrative appeal or contacting OGIS "
+        "(ogis@nara.gov). Constructive denial of request may entitle "
+        "you to immediate appeal."
+    ),
+    "India": (
+        "File a first appeal under Section 19(1) of the RTI Act with "
+        "the First Appellate Authority. The PIO's failure to respond "
+        "within 30 days is deemed a refusal."
+    ),
+    "UK": (
+        "Send a follow-up citing Section 10(1) of FOIA 2000. "
+        "Request an internal review. If no response within a reasonable "
+        "time, complain to the ICO."
+    ),
+    "EU": (
+        "The institution's silence after 15 working days constitutes "
+        "an implied refusal. File a confirmatory application under "
+        "Article 7(2) of Regulation 1049/2001."
+    ),
+    # Prefix entry: matches "US-State-IA", "US-State-TX", ...
+    "US-State": (
+        "Send a follow-up letter citing the state public records law and "
+        "its response deadline. Check the state's appeal route "
+        "(administrative appeal, attorney general review, or court action) "
+        "and prepare an appeal."
+    ),
+}
+_DEFAULT_OVERDUE_ACTION = "Send a follow-up letter and prepare an appeal."
 
+# _UPCOMING_ACTIONS[i] applies while days_left <= _UPCOMING_ACTION_LIMITS[i];
+# the last entry covers everything beyond the final limit.
+_UPCOMING_ACTION_LIMITS: tuple[int, ...] = (2, 5)
+_UPCOMING_ACTIONS: tuple[str, ...] = (
+    "Prepare appeal materials. Follow up with the agency immediately.",
+    "Send a courtesy follow-up to the FOIA officer inquiring about status.",
+    "Monitor. No action required yet.",
+)
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class Alert:
     """A single alert about a tracked request."""
 
@@ -38,28 +124,26 @@ class Alert:
     suggested_action: str
 
     def to_dict(self) -> dict:
-        return {
-            "request_id": self.request_id,
-            "agency": self.agency,
-            "jurisdiction": self.jurisdiction,
-            "topic": self.topic,
-            "severity": self.severity.value,
-            "message": self.message,
-            "days_remaining": self.days_remaining,
-            "deadline": self.deadline.isoformat() if self.deadline else None,
-            "suggested_action": self.suggested_action,
-        }
+        return dict(zip(_ALERT_KEYS, self.to_tuple()))
+
+    def to_tuple(self) -> tuple:
+        """JSON-ready field values, in the order of the to_dict() keys."""
+        return (
+            self.request_id,
+            self.agency,
+            self.jurisdiction,
+            self.topic,
+            self.severity.value,
+            self.message,
+            self.days_remaining,
+            self.deadline.isoformat() if self.deadline else None,
+            self.suggested_action,
+        )
 
     def format_text(self) -> str:
-        severity_prefix = {
-            AlertSeverity.INFO: "[INFO]",
-            AlertSeverity.WARNING: "[WARNING]",
-            AlertSeverity.URGENT: "[URGENT]",
-            AlertSeverity.OVERDUE: "[OVERDUE]",
-        }
-        prefix = severity_prefix[self.severity]
         return (
-            f"{prefix} Request #{self.request_id} — {self.agency}\n"
+            f"{_SEVERITY_PREFIXES[self.severity.order]} "
+            f"Request #{self.request_id} — {self.agency}\n"
             f"  Topic: {self.topic}\n"
             f"  {self.message}\n"
             f"  Action: {self.suggested_action}\n"
@@ -84,58 +168,129 @@ class AlertEngine:
         AlertSeverity.URGENT: 2,
     }
 
+    # Seconds a check_all() result may be reused. write_version only tracks
+    # writes made through this engine's TrackerDB, so the TTL bounds how long
+    # changes made by other processes or connections can go unseen.
+    MEMO_TTL = 30.0
+
     def __init__(self, db: TrackerDB) -> None:
         self.db = db
         self.calculator = DeadlineCalculator()
+        # THRESHOLDS sorted by days, for bisecting a days-left value
+        table = sorted((days, severity) for severity, days in self.THRESHOLDS.items())
+        self._threshold_days = tuple(days for days, _ in table)
+        self._threshold_severities = tuple(severity for _, severity in table)
+        # check_all() results, valid while (db.write_version, today) is
+        # unchanged and for at most MEMO_TTL seconds
+        self._memo: dict[tuple, list[Alert]] = {}
+        self._memo_stamp: Optional[tuple[int, date]] = None
+        self._memo_time = 0.0
 
-    def check_all(self) -> list[Alert]:
-        """Check all active requests and return alerts sorted by severity."""
-        alerts: list[Alert] = []
+    def check_all(
+        self,
+        severity_filter: Optional[AbstractSet[AlertSeverity]] = None,
+        max_days: Optional[int] = None,
+    ) -> list[Alert]:
+        """
+        Check all active requests and return alerts sorted by severity.
 
-        active_statuses = [
-            RequestStatus.FILED,
-            RequestStatus.ACKNOWLEDGED,
-            RequestStatus.PROCESSING,
-            RequestStatus.EXTENDED,
-            RequestStatus.APPEALED,
-        ]
+        ``severity_filter`` keeps only alerts of the given severities and
+        ``max_days`` skips requests whose deadline is more than that many
+        days away. Results are memoized until the tracker records a write
+        or the date changes, and for at most ``MEMO_TTL`` seconds.
+        """
+        today = date.today()
+        stamp = (self.db.write_version, today)
+        now = time.monotonic()
+        if stamp != self._memo_stamp or now - self._memo_time >= self.MEMO_TTL:
+            self._memo.clear()
+            self._memo_stamp = stamp
+            self._memo_time = now
 
-        for status in active_statuses:
-            requests = self.db.list_requests(status=status, limit=10000)
-            for req in requests:
-                alert = self._check_request(req)
-                if alert is not None:
-                    alerts.append(alert)
-
-        # Sort: OVERDUE first, then URGENT, WARNING, INFO
-        severity_order = {
-            AlertSeverity.OVERDUE: 0,
-            AlertSeverity.URGENT: 1,
-            AlertSeverity.WARNING: 2,
-            AlertSeverity.INFO: 3,
-        }
-        alerts.sort(key=lambda a: (severity_order.get(a.severity, 99), a.days_remaining or 0))
-        return alerts
+        key = (
+            frozenset(severity_filter) if severity_filter is not None else None,
+            max_days,
+        )
+        alerts = self._memo.get(key)
+        if alerts is None:
+            alerts = self._collect(today, severity_filter, max_days)
+            self._memo[key] = alerts
+        return list(alerts)
 
     def check_overdue(self) -> list[Alert]:
         """Return alerts only for overdue requests."""
-        return [a for a in self.check_all() if a.severity == AlertSeverity.OVERDUE]
+        return self.check_all(severity_filter={AlertSeverity.OVERDUE})
 
     def check_upcoming(self, within_days: int = 7) -> list[Alert]:
         """Return alerts for requests with deadlines within N days."""
         return [
-            a for a in self.check_all()
+            a for a in self.check_all(severity_filter=_UPCOMING, max_days=within_days)
             if a.days_remaining is not None and 0 < a.days_remaining <= within_days
         ]
 
-    def _check_request(self, req: FOIARequest) -> Optional[Alert]:
-        days_left = req.days_until_deadline()
-        effective_deadline = req.extended_deadline or req.deadline
+    @staticmethod
+    def alerts_to_jsonable(alerts: Iterable[Alert]) -> list[dict]:
+        """Serialize many alerts at once; equivalent to ``[a.to_dict() for a in alerts]``."""
+        keys = _ALERT_KEYS
+        return [dict(zip(keys, alert.to_tuple())) for alert in alerts]
+
+    def _collect(
+        self,
+        today: date,
+        severity_filter: Optional[AbstractSet[AlertSeverity]],
+        max_days: Optional[int],
+    ) -> list[Alert]:
+        alerts: list[Alert] = []
+
+        # Let the database drop requests that cannot produce a wanted alert:
+        # no deadline, or a deadline beyond the widest threshold.
+        horizon = self._threshold_days[-1]
+        if max_days is not None:
+            horizon = min(horizon, max_days)
+        want_overdue = severity_filter is None or AlertSeverity.OVERDUE in severity_filter
+        if severity_filter is not None and severity_filter <= {AlertSeverity.OVERDUE}:
+            requests = self.db.list_overdue(today, _ACTIVE_STATUSES, summary=True)
+        else:
+            requests = self.db.list_due_within(
+                horizon, today, _ACTIVE_STATUSES, include_overdue=want_overdue, summary=True
+            )
+        for req in requests:
+            alert = self._check_request(req, today, severity_filter, max_days)
+            if alert is not None:
+                alerts.append(alert)
+
+        # Sort: OVERDUE first, then URGENT, WARNING, INFO. Every alert built
+        # by _check_request has an integer days_remaining.
+        alerts.sort(key=_SORT_KEY)
+        return alerts
 
-        if days_left is None:
+    def _check_request(
+        self,
+        req: FOIARequest,
+        today: date,
+        severity_filter: Optional[AbstractSet[AlertSeverity]] = None,
+        max_days: Optional[int] = None,
+    ) -> Optional[Alert]:
+        effective_deadline = req.effective_deadline
+        if effective_deadline is None:
+            return None
+
+        days_left = (effective_deadline - today).days
+        if max_days is not None and days_left > max_days:
             return None
 
         if days_left < 0:
+            severity = AlertSeverity.OVERDUE
+        else:
+            index = bisect_left(self._threshold_days, days_left)
+            if index == len(self._threshold_days):
+                return None
+            severity = self._threshold_severities[index]
+
+        if severity_filter is not None and severity not in severity_filter:
+            return None
+
+        if severity is AlertSeverity.OVERDUE:
             days_overdue = abs(days_left)
             return Alert(
                 request_id=req.id,
@@ -149,18 +304,9 @@ class AlertEngine:
                 ),
                 days_remaining=days_left,
                 deadline=effective_deadline,
-                suggested_action=self._overdue_action(req),
+                suggested_action=self._overdue_action(req.jurisdiction),
             )
 
-        if days_left <= self.THRESHOLDS[AlertSeverity.URGENT]:
-            severity = AlertSeverity.URGENT
-        elif days_left <= self.THRESHOLDS[AlertSeverity.WARNING]:
-            severity = AlertSeverity.WARNING
-        elif days_left <= self.THRESHOLDS[AlertSeverity.INFO]:
-            severity = AlertSeverity.INFO
-        else:
-            return None
-
         return Alert(
             request_id=req.id,
             agency=req.agency,
@@ -174,38 +320,14 @@ class AlertEngine:
         )
 
     @staticmethod
-    def _overdue_action(req: FOIARequest) -> str:
-        if req.jurisdiction == "US-Federal":
-            return (
-                "Send a follow-up letter citing 5 U.S.C. Section 552(a)(6)(A). "
-                "Consider filing an administrative appeal or contacting OGIS "
-                "(ogis@nara.gov). Constructive denial of request may entitle "
-                "you to immediate appeal."
-            )
-        if req.jurisdiction == "India":
-            return (
-                "File a first appeal under Section 19(1) of the RTI Act with "
-                "the First Appellate Authority. The PIO's failure to respond "
-                "within 30 days is deemed a refusal."
-            )
-        if req.jurisdiction == "UK":
-            return (
-                "Send a follow-up citing Section 10(1) of FOIA 2000. "
-                "Request an internal review. If no response within a reasonable "
-                "time, complain to the ICO."
-            )
-        if req.jurisdiction == "EU":
-            return (
-                "The institution's silence after 15 working days constitutes "
-                "an implied refusal. File a confirmatory application under "
-                "Article 7(2) of Regulation 1049/2001."
-            )
-        return "Send a follow-up letter and prepare an appeal."
+    def _overdue_action(jurisdiction: str) -> str:
+        action = _OVERDUE_ACTIONS.get(jurisdiction)
+        if action is None:
+            # Fall back to the jurisdiction family, e.g. "US-State-IA" -> "US-State"
+            prefix = jurisdiction.rpartition("-")[0]
+            action = _OVERDUE_ACTIONS.get(prefix, _DEFAULT_OVERDUE_ACTION)
+        return action
 
     @staticmethod
     def _upcoming_action(req: FOIARequest, days_left: int) -> str:
-        if days_left <= 2:
-            return "Prepare appeal materials. Follow up with the agency immediately."
-        if days_left <= 5:
-            return "Send a courtesy follow-up to the FOIA officer inquiring about status."
-        return "Monitor. No action required yet."
+        return _UPCOMING_ACTIONS[bisect_left(_UPCOMING_ACTION_LIMITS, days_left)]
@@ -8,8 +8,12 @@ appeals ready for filing.
 
 from __future__ import annotations
 
-from datetime import date, datetime
-from typing import Optional
+import sys
+from collections.abc import Iterable, Sequence
+from datetime import date
+from functools import lru_cache
+from string import Formatter
+from typing import Any, Optional, TextIO
 
 from foia_rti.tracker.tracker import FOIARequest, RequestStatus
 
@@ -239,6 +243,178 @@ Yours faithfully,
 """
 
 
+@lru_cache(maxsize=4096)
+def _fmt_date(d: date) -> str:
+    return d.strftime("%B %d, %Y")
+
+
+def _fmt_date_or(d: Optional[date], default: str) -> str:
+    return _fmt_date(d) if d else default
+
+
+# Every field an appeal template may reference, in the order _prepare()
+# lays out the letter values.
+_APPEAL_FIELDS: tuple[str, ...] = (
+    "filing_date",
+    "agency",
+    "reference_id",
+    "date_filed",
+    "date_response",
+    "topic",
+    "denial_details",
+    "appeal_grounds",
+    "additional_arguments",
+    "requester_name",
+    "requester_org",
+    "requester_email",
+    "appeal_to",
+    "determination_type",
+)
+
+
+class _FormatRenderer:
+    """
+    A ``str.format`` template split into literal text and field positions
+    once. Calling it with values laid out as in ``_APPEAL_FIELDS`` is
+    equivalent to ``template.format_map(dict(zip(_APPEAL_FIELDS, values)))``;
+    only plain ``{name}`` fields are supported.
+    """
+
+    __slots__ = ("parts",)
+
+    def __init__(self, template: str) -> None:
+        parts: list[tuple[str, Optional[int]]] = []
+        for literal, field_name, spec, conversion in Formatter().parse(template):
+            if spec or conversion:
+                raise ValueError(
+                    f"Unsupported format field '{{{field_name}}}' in appeal template"
+                )
+            if field_name is not None and field_name not in _APPEAL_FIELDS:
+                raise ValueError(f"Unknown appeal template field '{{{field_name}}}'")
+            # Literal chunks such as blank lines recur across templates;
+            # interning lets every renderer share one copy of each.
+            parts.append(
+                (
+                    sys.intern(literal),
+                    None if field_name is None else _APPEAL_FIELDS.index(field_name),
+                )
+            )
+        self.parts = tuple(parts)
+
+    def __call__(self, values: Sequence[Any]) -> str:
+        out: list[str] = []
+        for literal, index in self.parts:
+            out.append(literal)
+            if index is not None:
+                out.append(str(values[index]))
+        return "".join(out)
+
+    def write_into(self, out: TextIO, values: Sequence[Any]) -> None:
+        """Write the rendered text to *out* without building it in memory."""
+        write = out.write
+        for literal, index in self.parts:
+            write(literal)
+            if index is not None:
+                write(str(values[index]))
+
+
+_RENDER_US_FEDERAL = _FormatRenderer(US_FEDERAL_APPEAL_TEMPLATE)
+
+# Appeal letter per jurisdiction as (renderer, appeal_to, determination_type).
+# Only the US federal format reads appeal_to and determination_type; a None
+# determination_type is derived from the request status. "US-State-*"
+# jurisdictions use _US_STATE_APPEAL_LETTER, and anything else not listed
+# falls back to the US federal format.
+_AppealLetter = tuple[_FormatRenderer, Optional[str], Optional[str]]
+
+_US_STATE_APPEAL_LETTER: _AppealLetter = (_RENDER_US_FEDERAL, "FOIA Appeals Officer", None)
+
+_APPEAL_LETTERS: dict[str, _AppealLetter] = {
+    "US-Federal": (_RENDER_US_FEDERAL, "FOIA Appeals Officer", None),
+    "India": (_FormatRenderer(INDIA_APPEAL_TEMPLATE), None, None),
+    "UK": (_FormatRenderer(UK_APPEAL_TEMPLATE), None, None),
+    "EU": (_FormatRenderer(EU_APPEAL_TEMPLATE), None, None),
+}
+_DEFAULT_APPEAL_LETTER: _AppealLetter = (_RENDER_US_FEDERAL, "Appeals Officer", "denial")
+
+
+def _appeal_letter(jurisdiction: str) -> _AppealLetter:
+    letter = _APPEAL_LETTERS.get(jurisdiction)
+    if letter is not None:
+        return letter
+    if jurisdiction.startswith("US-State"):
+        return _US_STATE_APPEAL_LETTER
+    return _DEFAULT_APPEAL_LETTER
+
+
+# ---------------------------------------------------------------------------
+# Fixed passages for denial details and appeal grounds
+# ---------------------------------------------------------------------------
+
+_CONSTRUCTIVE_DENIAL_DETAILS = (
+    "The agency has failed to respond within the statutory time "
+    "limit, which constitutes a constructive denial."
+)
+_INADEQUATE_RESPONSE_DETAILS = "The agency's response was inadequate or incomplete."
+
+_OVERDUE_GROUNDS = (
+    "The agency failed to respond within the statutory deadline. "
+    "This failure constitutes a constructive denial and entitles "
+    "the requester to appeal."
+)
+_INADEQUATE_RESPONSE_GROUNDS = (
+    "The agency's response was inadequate. The request sought specific, "
+    "identifiable records, and the agency has not demonstrated a diligent "
+    "search or provided a sufficient justification for non-disclosure."
+)
+
+_NONRESPONSE_GROUNDS: dict[str, str] = {
+    "US-Federal": (
+        "The agency has failed to comply with the 20 business day "
+        "response requirement of 5 U.S.C. Section 552(a)(6)(A)(i). "
+        "Under established precedent, this failure constitutes a "
+        "constructive denial of the request and entitles the requester "
+        "to immediately appeal. See Oglesby v. U.S. Dept. of Army, "
+        "920 F.2d 57 (D.C. Cir. 1990)."
+    ),
+    "India": (
+        "The PIO has failed to provide information within the 30-day "
+        "period prescribed by Section 7(1) of the RTI Act, 2005. "
+        "Under Section 7(2), the failure to give a decision within "
+        "the prescribed period is deemed a refusal. The PIO may be "
+        "liable for penalty under Section 20."
+    ),
+    "UK": (
+        "The authority has failed to comply with the 20 working day "
+        "time limit imposed by Section 10(1) of the Freedom of "
+        "Information Act 2000. This constitutes a breach of the Act."
+    ),
+    "EU": (
+        "The institution has failed to reply within the 15 working "
+        "day deadline prescribed by Article 7(1) of Regulation "
+        "1049/2001. Under established case law, the applicant is "
+        "entitled to submit a confirmatory application."
+    ),
+}
+_DEFAULT_NONRESPONSE_GROUNDS = (
+    "The agency failed to respond within the legally required timeframe."
+)
+
+_FEE_WAIVER_ARGUMENT = (
+    "Additionally, the denial of the fee waiver request was "
+    "improper. The requester is a nonprofit organization seeking "
+    "information in the public interest. The requested information "
+    "will contribute significantly to public understanding of "
+    "government operations."
+)
+
+# Determination wording for statuses that fix it regardless of deadlines
+_DETERMINATION_TYPES: dict[RequestStatus, str] = {
+    RequestStatus.DENIED: "denial",
+    RequestStatus.PARTIAL_RESPONSE: "partial denial",
+}
+
+
 class AppealGenerator:
     """
     Generate jurisdiction-appropriate appeal letters.
@@ -257,53 +433,51 @@ class AppealGenerator:
         requester_email: str = "",
     ) -> str:
         """Generate an appeal letter for the given request."""
-        jurisdiction = request.jurisdiction
-
-        denial_details = self._build_denial_details(request)
-        appeal_grounds = grounds or self._default_grounds(request)
-        additional = self._additional_arguments(request)
+        render, values = self._prepare(
+            request,
+            date.today(),
+            grounds,
+            requester_name,
+            requester_org,
+            requester_email,
+        )
+        return render(values)
 
-        common_vars = {
-            "filing_date": datetime.now().strftime("%B %d, %Y"),
-            "agency": request.agency,
-            "reference_id": request.reference_id or f"Tracker #{request.id}",
-            "date_filed": (
-                request.date_filed.strftime("%B %d, %Y")
-                if request.date_filed
-                else "N/A"
-            ),
-            "date_response": (
-                request.date_response.strftime("%B %d, %Y")
-                if request.date_response
-                else "no response received",
-            ),
-            "topic": request.topic,
-            "denial_details": denial_details,
-            "appeal_grounds": appeal_grounds,
-            "additional_arguments": additional,
-            "requester_name": requester_name,
-            "requester_org": requester_org,
-            "requester_email": requester_email,
-        }
-
-        if jurisdiction == "US-Federal" or jurisdiction.startswith("US-State"):
-            common_vars["appeal_to"] = "FOIA Appeals Officer"
-            common_vars["determination_type"] = self._determination_type(request)
-            return US_FEDERAL_APPEAL_TEMPLATE.format(**common_vars)
-
-        if jurisdiction == "India":
-            return INDIA_APPEAL_TEMPLATE.format(**common_vars)
-
-        if jurisdiction == "UK":
-            return UK_APPEAL_TEMPLATE.format(**common_vars)
-
-        if jurisdiction == "EU":
-            return EU_APPEAL_TEMPLATE.format(**common_vars)
-
-        # Fallback to US federal format
-        common_vars["appeal_to"] = "Appeals Officer"
-        common_vars["determination_type"] = "denial"
-        return US_FEDERAL_APPEAL_TEMPLATE.format(**common_vars)
+    def generate_appeals_bulk(
+        self,
+        requests: Iterable[FOIARequest],
+        out: TextIO,
+        grounds: str = "",
+        requester_name: str = "Open Paws Research",
+        requester_org: str = "Open Paws",
+        requester_email: str = "",
+        separator: str = "\f",
+    ) -> int:
+        """
+        Write an appeal letter for each request to the text stream *out*.
+
+        Letters are written straight into the stream, separated by
+        *separator* (a form feed by default), so an appeal pack can be
+        streamed to a file without holding every letter in memory. The date
+        is read once for the whole batch; each letter matches what
+        generate_appeal() returns. Returns the number of letters written.
+        """
+        today = date.today()
+        count = 0
+        for request in requests:
+            if count:
+                out.write(separator)
+            render, values = self._prepare(
+                request,
+                today,
+                grounds,
+                requester_name,
+                requester_org,
+                requester_email,
+            )
+            render.write_into(out, values)
+            count += 1
+        return count
 
     def generate_appeal_for_nonresponse(
         self,
@@ -313,7 +487,7 @@ class AppealGenerator:
         requester_email: str = "",
     ) -> str:
         """Generate an appeal specifically for constructive denial (no response)."""
-        grounds = self._nonresponse_grounds(request)
+        grounds = self._nonresponse_grounds(request.jurisdiction)
         return self.generate_appeal(
             request,
             grounds=grounds,
@@ -324,102 +498,104 @@ class AppealGenerator:
 
     # ---- internal helpers ----
 
+    def _prepare(
+        self,
+        request: FOIARequest,
+        today: date,
+        grounds: str,
+        requester_name: str,
+        requester_org: str,
+        requester_email: str,
+    ) -> tuple[_FormatRenderer, tuple[str, ...]]:
+        """Pick the renderer for the request's jurisdiction and build its values."""
+        jurisdiction = request.jurisdiction
+        status = request.status
+        exemptions = request.exemptions_cited
+        overdue = request.is_overdue(today)
+
+        denial_details = self._build_denial_details(request, status, exemptions, overdue)
+        appeal_grounds = grounds or self._default_grounds(exemptions, overdue)
+        additional = self._additional_arguments(request)
+
+        render, appeal_to, determination = _appeal_letter(jurisdiction)
+        if appeal_to is None:
+            appeal_to = determination = ""
+        elif determination is None:
+            determination = self._determination_type(status, overdue)
+
+        # Laid out as in _APPEAL_FIELDS
+        values = (
+            _fmt_date(today),
+            request.agency,
+            request.reference_id or f"Tracker #{request.id}",
+            _fmt_date_or(request.date_filed, "N/A"),
+            _fmt_date_or(request.date_response, "no response received"),
+            request.topic,
+            denial_details,
+            appeal_grounds,
+            additional,
+            requester_name,
+            requester_org,
+            requester_email,
+            appeal_to,
+            determination,
+        )
+        return render, values
+
     @staticmethod
-    def _build_denial_details(req: FOIARequest) -> str:
-        if req.status == RequestStatus.DENIED and req.exemptions_cited:
+    def _build_denial_details(
+        req: FOIARequest,
+        status: RequestStatus,
+        exemptions: Optional[str],
+        overdue: bool,
+    ) -> str:
+        if status == RequestStatus.DENIED and exemptions:
             return (
                 f"The agency denied the request, citing the following "
-                f"exemption(s): {req.exemptions_cited}."
+                f"exemption(s): {exemptions}."
             )
-        if req.status == RequestStatus.PARTIAL_RESPONSE:
+        if status == RequestStatus.PARTIAL_RESPONSE:
             withheld = req.pages_withheld or 0
             received = req.pages_received or 0
-            exs = req.exemptions_cited or "not specified"
+            exs = exemptions or "not specified"
             return (
                 f"The agency provided a partial response: {received} pages "
                 f"released, {withheld} pages withheld. Exemptions cited: {exs}."
             )
-        if req.is_overdue():
-            return (
-                "The agency has failed to respond within the statutory time "
-                "limit, which constitutes a constructive denial."
-            )
-        return "The agency's response was inadequate or incomplete."
+        if overdue:
+            return _CONSTRUCTIVE_DENIAL_DETAILS
+        return _INADEQUATE_RESPONSE_DETAILS
 
     @staticmethod
-    def _determination_type(req: FOIARequest) -> str:
-        if req.status == RequestStatus.DENIED:
-            return "denial"
-        if req.status == RequestStatus.PARTIAL_RESPONSE:
-            return "partial denial"
-        if req.is_overdue():
+    def _determination_type(status: RequestStatus, overdue: bool) -> str:
+        determination = _DETERMINATION_TYPES.get(status)
+        if determination is not None:
+            return determination
+        if overdue:
             return "constructive denial (failure to respond within statutory deadline)"
         return "adverse determination"
 
     @staticmethod
-    def _default_grounds(req: FOIARequest) -> str:
-        if req.exemptions_cited:
+    def _default_grounds(exemptions: Optional[str], overdue: bool) -> str:
+        if exemptions:
             return (
-                f"The exemption(s) cited ({req.exemptions_cited}) were "
+                f"The exemption(s) cited ({exemptions}) were "
                 "improperly applied. The records do not fall within the scope "
                 "of the cited exemption(s), or the agency has failed to "
                 "demonstrate the necessary harm that would result from disclosure."
             )
-        if req.is_overdue():
-            return (
-                "The agency failed to respond within the statutory deadline. "
-                "This failure constitutes a constructive denial and entitles "
-                "the requester to appeal."
-            )
-        return (
-            "The agency's response was inadequate. The request sought specific, "
-            "identifiable records, and the agency has not demonstrated a diligent "
-            "search or provided a sufficient justification for non-disclosure."
-        )
+        if overdue:
+            return _OVERDUE_GROUNDS
+        return _INADEQUATE_RESPONSE_GROUNDS
 
     @staticmethod
-    def _nonresponse_grounds(req: FOIARequest) -> str:
-        juris = req.jurisdiction
-        if juris == "US-Federal":
-            return (
-                "The agency has failed to comply with the 20 business day "
-                "response requirement of 5 U.S.C. Section 552(a)(6)(A)(i). "
-                "Under established precedent, this failure constitutes a "
-                "constructive denial of the request and entitles the requester "
-                "to immediately appeal. See Oglesby v. U.S. Dept. of Army, "
-                "920 F.2d 57 (D.C. Cir. 1990)."
-            )
-        if juris == "India":
-            return (
-                "The PIO has failed to provide information within the 30-day "
-                "period prescribed by Section 7(1) of the RTI Act, 2005. "
-                "Under Section 7(2), the failure to give a decision within "
-                "the prescribed period is deemed a refusal. The PIO may be "
-                "liable for penalty under Section 20."
-            )
-        if juris == "UK":
-            return (
-                "The authority has failed to comply with the 20 working day "
-                "time limit imposed by Section 10(1) of the Freedom of "
-                "Information Act 2000. This constitutes a breach of the Act."
-            )
-        if juris == "EU":
-            return (
-                "The institution has failed to reply within the 15 working "
-                "day deadline prescribed by Article 7(1) of Regulation "
-                "1049/2001. Under established case law, the applicant is "
-                "entitled to submit a confirmatory application."
-            )
-        return "The agency failed to respond within the legally required timeframe."
+    def _nonresponse_grounds(jurisdiction: str) -> str:
+        return _NONRESPONSE_GROUNDS.get(jurisdiction, _DEFAULT_NONRESPONSE_GROUNDS)
 
     @staticmethod
     def _additional_arguments(req: FOIARequest) -> str:
+        # fee_waiver_granted is None until the agency decides; only an
+        # explicit refusal warrants the argument.
         if req.fee_waiver_requested and req.fee_waiver_granted is False:
-            return (
-                "Additionally, the denial of the fee waiver request was "
-                "improper. The requester is a nonprofit organization seeking "
-                "information in the public interest. The requested information "
-                "will contribute significantly to public understanding of "
-                "government operations."
-            )
+            return _FEE_WAIVER_ARGUMENT
         return ""
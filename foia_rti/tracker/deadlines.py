@@ -10,10 +10,25 @@ Accounts for:
 
 from __future__ import annotations
 
+from bisect import bisect_right
+from collections.abc import Mapping
 from datetime import date, timedelta
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Optional
 
 
+def _holidays_in_year(rule, year: int) -> frozenset[date]:
+    """All dates in *year* for which the holiday *rule* predicate holds."""
+    day = date(year, 1, 1)
+    holidays = set()
+    while day.year == year:
+        if rule(day):
+            holidays.add(day)
+        day += timedelta(days=1)
+    return frozenset(holidays)
+
+
 # Major US federal holidays (fixed-date approximations + rules)
 # In production, use a proper holiday calendar library.
 US_FEDERAL_HOLIDAYS_FIXED = {
@@ -25,8 +40,7 @@ US_FEDERAL_HOLIDAYS_FIXED = {
 }
 
 
-def _is_us_federal_holiday(d: date) -> bool:
-    """Check if a date falls on a US federal holiday (simplified)."""
+def _us_federal_holiday_rule(d: date) -> bool:
     if (d.month, d.day) in US_FEDERAL_HOLIDAYS_FIXED:
         return True
     # MLK Day: 3rd Monday of January
@@ -50,6 +64,16 @@ def _is_us_federal_holiday(d: date) -> bool:
     return False
 
 
+@lru_cache(maxsize=64)
+def _us_federal_holidays(year: int) -> frozenset[date]:
+    return _holidays_in_year(_us_federal_holiday_rule, year)
+
+
+def _is_us_federal_holiday(d: date) -> bool:
+    """Check if a date falls on a US federal holiday (simplified)."""
+    return d in _us_federal_holidays(d.year)
+
+
 # UK bank holidays (England & Wales, simplified fixed dates)
 UK_BANK_HOLIDAYS_FIXED = {
     (1, 1),   # New Year's Day
@@ -58,7 +82,7 @@ UK_BANK_HOLIDAYS_FIXED = {
 }
 
 
-def _is_uk_bank_holiday(d: date) -> bool:
+def _uk_bank_holiday_rule(d: date) -> bool:
     if (d.month, d.day) in UK_BANK_HOLIDAYS_FIXED:
         return True
     # Early May bank holiday: 1st Monday of May
@@ -73,10 +97,48 @@ def _is_uk_bank_holiday(d: date) -> bool:
     return False
 
 
+@lru_cache(maxsize=64)
+def _uk_bank_holidays(year: int) -> frozenset[date]:
+    return _holidays_in_year(_uk_bank_holiday_rule, year)
+
+
+def _is_uk_bank_holiday(d: date) -> bool:
+    return d in _uk_bank_holidays(d.year)
+
+
 def _is_weekend(d: date) -> bool:
     return d.weekday() >= 5
 
 
+def _add_weekdays(start: date, days: int) -> date:
+    """Add *days* (>= 1) Monday-to-Friday days to *start*, ignoring holidays."""
+    weekday = start.weekday()
+    if weekday >= 5:
+        # Counting from a weekend is the same as counting from the Friday before
+        start -= timedelta(days=weekday - 4)
+        weekday = 4
+    weeks, rem = divmod(days, 5)
+    skip_weekend = 2 if weekday + rem >= 5 else 0
+    return start + timedelta(days=weeks * 7 + rem + skip_weekend)
+
+
+@lru_cache(maxsize=256)
+def _weekday_holidays(holiday_fn, year: int) -> tuple[date, ...]:
+    """Sorted holidays in *year*, as reported by *holiday_fn*, that fall on weekdays."""
+    return tuple(sorted(
+        day for day in _holidays_in_year(holiday_fn, year) if day.weekday() < 5
+    ))
+
+
+def _count_holidays(holiday_fn, after: date, through: date) -> int:
+    """Number of weekday holidays in the interval (after, through]."""
+    count = 0
+    for year in range(after.year, through.year + 1):
+        holidays = _weekday_holidays(holiday_fn, year)
+        count += bisect_right(holidays, through) - bisect_right(holidays, after)
+    return count
+
+
 def add_business_days(
     start: date,
     days: int,
@@ -84,14 +146,12 @@ def add_business_days(
 ) -> date:
     """Add N business days to a start date, skipping weekends and holidays."""
     current = start
-    added = 0
-    while added < days:
-        current += timedelta(days=1)
-        if _is_weekend(current):
-            continue
-        if holiday_fn and holiday_fn(current):
-            continue
-        added += 1
+    while days > 0:
+        target = _add_weekdays(current, days)
+        # Holidays passed over were counted as business days; add one more
+        # business day for each, which may in turn pass over further holidays.
+        days = _count_holidays(holiday_fn, current, target) if holiday_fn else 0
+        current = target
     return current
 
 
@@ -100,6 +160,17 @@ def add_calendar_days(start: date, days: int) -> date:
     return start + timedelta(days=days)
 
 
+@lru_cache(maxsize=8192)
+def _deadline(start: date, days: int, day_type: str, holiday_fn=None) -> date:
+    """
+    Deadline *days* business or calendar days after *start*. Keyed on the
+    rule values themselves, so custom rules need no cache invalidation.
+    """
+    if day_type == "business":
+        return add_business_days(start, days, holiday_fn)
+    return add_calendar_days(start, days)
+
+
 # ---------------------------------------------------------------------------
 # Jurisdiction deadline rules
 # ---------------------------------------------------------------------------
@@ -156,6 +227,51 @@ JURISDICTION_RULES: dict[str, dict] = {
     },
 }
 
+_DEFAULT_RULES: Mapping[str, dict] = MappingProxyType(JURISDICTION_RULES)
+_DEFAULT_JURISDICTIONS: tuple[str, ...] = tuple(JURISDICTION_RULES)
+
+# State deadlines vary; "US-State-*" jurisdictions without their own rule
+# fall back to a generic 10 business day default.
+_US_STATE_DEFAULT_RULE: dict = {
+    "initial_days": 10,
+    "day_type": "business",
+    "holiday_fn": _is_us_federal_holiday,
+    "extension_days": 0,
+    "extension_type": "business",
+    "notes": "State deadlines vary. Check state-specific rules.",
+}
+
+
+def _rule_for(jurisdiction: str, rules: Mapping[str, dict]) -> dict:
+    # Try direct match
+    rule = rules.get(jurisdiction)
+    if rule is not None:
+        return rule
+    # Try state-level (e.g. "US-State-IA" -> use "US-Federal" biz day logic)
+    if jurisdiction.startswith("US-State"):
+        return _US_STATE_DEFAULT_RULE
+    raise ValueError(
+        f"No deadline rules for jurisdiction '{jurisdiction}'. "
+        f"Known: {', '.join(rules)}"
+    )
+
+
+def compute_deadline(
+    jurisdiction: str,
+    filed_date: date,
+    rules: Mapping[str, dict] = _DEFAULT_RULES,
+) -> date:
+    """
+    Calculate the initial response deadline under *rules*.
+
+    This is the function form of ``DeadlineCalculator().calculate()`` and
+    the cheaper call for code that only needs the built-in rules.
+    """
+    rule = _rule_for(jurisdiction, rules)
+    return _deadline(
+        filed_date, rule["initial_days"], rule["day_type"], rule.get("holiday_fn")
+    )
+
 
 class DeadlineCalculator:
     """
@@ -168,9 +284,14 @@ class DeadlineCalculator:
     """
 
     def __init__(self, custom_rules: Optional[dict] = None) -> None:
-        self.rules = dict(JURISDICTION_RULES)
+        # Without overrides, share a read-only view of the module rules
+        # rather than copying them for every calculator.
         if custom_rules:
-            self.rules.update(custom_rules)
+            self.rules: Mapping[str, dict] = {**JURISDICTION_RULES, **custom_rules}
+            self._jurisdictions = tuple(self.rules)
+        else:
+            self.rules = _DEFAULT_RULES
+            self._jurisdictions = _DEFAULT_JURISDICTIONS
 
     def calculate(
         self,
@@ -178,11 +299,7 @@ class DeadlineCalculator:
         filed_date: date,
     ) -> date:
         """Calculate the initial response deadline."""
-        rule = self._get_rule(jurisdiction)
-        days = rule["initial_days"]
-        if rule["day_type"] == "business":
-            return add_business_days(filed_date, days, rule.get("holiday_fn"))
-        return add_calendar_days(filed_date, days)
+        return compute_deadline(jurisdiction, filed_date, self.rules)
 
     def calculate_extension(
         self,
@@ -194,9 +311,9 @@ class DeadlineCalculator:
         ext_days = rule.get("extension_days", 0)
         if ext_days == 0:
             return None
-        if rule["extension_type"] == "business":
-            return add_business_days(original_deadline, ext_days, rule.get("holiday_fn"))
-        return add_calendar_days(original_deadline, ext_days)
+        return _deadline(
+            original_deadline, ext_days, rule["extension_type"], rule.get("holiday_fn")
+        )
 
     def get_jurisdiction_info(self, jurisdiction: str) -> dict:
         """Return human-readable information about a jurisdiction's rules."""
@@ -210,24 +327,7 @@ class DeadlineCalculator:
         }
 
     def list_jurisdictions(self) -> list[str]:
-        return list(self.rules.keys())
+        return list(self._jurisdictions)
 
     def _get_rule(self, jurisdiction: str) -> dict:
-        # Try direct match
-        if jurisdiction in self.rules:
-            return self.rules[jurisdiction]
-        # Try prefix match for state-level (e.g. "US-State-IA" -> use "US-Federal" biz day logic)
-        if jurisdiction.startswith("US-State"):
-            # State deadlines vary; fall back to a generic 10 business day default
-            return {
-                "initial_days": 10,
-                "day_type": "business",
-                "holiday_fn": _is_us_federal_holiday,
-                "extension_days": 0,
-                "extension_type": "business",
-                "notes": "State deadlines vary. Check state-specific rules.",
-            }
-        raise ValueError(
-            f"No deadline rules for jurisdiction '{jurisdiction}'. "
-            f"Known: {', '.join(self.rules.keys())}"
-        )
+        return _rule_for(jurisdiction, self.rules)
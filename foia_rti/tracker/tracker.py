@@ -8,22 +8,38 @@ deadlines, responses, documents received, and notes.
 from __future__ import annotations
 
 import enum
-from datetime import date, datetime
+from collections.abc import Iterable, Iterator, Mapping
+from datetime import date, datetime, timedelta
+from itertools import islice
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 from sqlalchemy import (
     Column,
+    ColumnElement,
     Date,
     DateTime,
     Enum,
+    Index,
     Integer,
     String,
     Text,
     Boolean,
+    and_,
+    case,
     create_engine,
+    event,
+    func,
+    insert,
+    or_,
+    select,
+    tuple_,
+    update,
 )
-from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.orm import DeclarativeBase, Session, load_only, scoped_session, sessionmaker
+from sqlalchemy.pool import StaticPool
 
 
 class Base(DeclarativeBase):
@@ -49,10 +65,25 @@ class RequestStatus(enum.Enum):
     NO_RESPONSIVE_RECORDS = "no_responsive_records"
 
 
+_TERMINAL_STATUSES = (
+    RequestStatus.COMPLETE,
+    RequestStatus.DENIED,
+    RequestStatus.WITHDRAWN,
+    RequestStatus.NO_RESPONSIVE_RECORDS,
+)
+
+
 class FOIARequest(Base):
     """A single public records request and its lifecycle data."""
 
     __tablename__ = "foia_requests"
+    __table_args__ = (
+        # Serves the overdue and due-soon filters: status plus both deadline
+        # columns, so the effective deadline is read from the index.
+        Index("ix_foia_requests_status_deadlines", "status", "extended_deadline", "deadline"),
+        # Newest-first listing and its (date_created, id) page cursor
+        Index("ix_foia_requests_created_id", "date_created", "id"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     # --- identification ---
@@ -99,24 +130,89 @@ class FOIARequest(Base):
             f"status={self.status.value}, jurisdiction='{self.jurisdiction}')>"
         )
 
-    def is_overdue(self) -> bool:
-        if self.status in (
-            RequestStatus.COMPLETE,
-            RequestStatus.DENIED,
-            RequestStatus.WITHDRAWN,
-            RequestStatus.NO_RESPONSIVE_RECORDS,
-        ):
+    @hybrid_property
+    def effective_deadline(self) -> Optional[date]:
+        """The extended deadline when one was granted, else the original deadline."""
+        return self.extended_deadline or self.deadline
+
+    @effective_deadline.inplace.expression
+    @classmethod
+    def _effective_deadline_expression(cls):
+        return func.coalesce(cls.extended_deadline, cls.deadline)
+
+    def is_overdue(self, today: Optional[date] = None) -> bool:
+        if self.status in _TERMINAL_STATUSES:
             return False
-        effective_deadline = self.extended_deadline or self.deadline
+        effective_deadline = self.effective_deadline
         if effective_deadline is None:
             return False
-        return date.today() > effective_deadline
+        return (today or date.today()) > effective_deadline
 
-    def days_until_deadline(self) -> Optional[int]:
-        effective_deadline = self.extended_deadline or self.deadline
+    def days_until_deadline(self, today: Optional[date] = None) -> Optional[int]:
+        effective_deadline = self.effective_deadline
         if effective_deadline is None:
             return None
-        return (effective_deadline - date.today()).days
+        return (effective_deadline - (today or date.today())).days
+
+
+# Filter for requests still awaiting a final disposition, built once
+_NOT_TERMINAL: ColumnElement[bool] = FOIARequest.status.notin_(_TERMINAL_STATUSES)
+
+# Columns loaded for list views, which never show the Text columns
+_SUMMARY_COLUMNS = (
+    FOIARequest.id,
+    FOIARequest.reference_id,
+    FOIARequest.agency,
+    FOIARequest.jurisdiction,
+    FOIARequest.topic,
+    FOIARequest.status,
+    FOIARequest.date_created,
+    FOIARequest.date_filed,
+    FOIARequest.deadline,
+    FOIARequest.extended_deadline,
+)
+
+# Expression index matching FOIARequest.effective_deadline, so deadline
+# range filters seek on the index instead of evaluating COALESCE per row.
+Index("ix_foia_requests_effective_deadline", FOIARequest.effective_deadline)
+
+
+def _engine_options(url: URL) -> dict[str, Any]:
+    """Backend-specific create_engine() options for pooling and fast executemany."""
+    backend, driver = url.get_backend_name(), url.get_driver_name()
+    if backend == "sqlite":
+        if not _is_sqlite_file(url):
+            # One shared connection, so every thread sees the same in-memory
+            # database rather than a private empty one.
+            return {"poolclass": StaticPool, "connect_args": {"check_same_thread": False}}
+        # Wait up to 30s for another writer's lock instead of failing with
+        # "database is locked" after the default 5s.
+        return {"connect_args": {"timeout": 30}}
+
+    # Server databases: drop connections the server closed while idle
+    # instead of failing the next query on them.
+    options: dict[str, Any] = {"pool_pre_ping": True, "pool_recycle": 1800}
+    if backend == "postgresql" and driver == "psycopg2":
+        options.update(executemany_mode="values_plus_batch", insertmanyvalues_page_size=500)
+    elif backend == "mssql" and driver == "pyodbc":
+        options["fast_executemany"] = True
+    return options
+
+
+def _is_sqlite_file(url: URL) -> bool:
+    return url.get_backend_name() == "sqlite" and url.database not in (None, "", ":memory:")
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    # WAL lets readers proceed during a write and makes each commit a
+    # sequential append; synchronous=NORMAL is the recommended pairing.
+    # A 256 MiB mmap window and 64 MiB page cache cut read syscalls.
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.execute("PRAGMA cache_size=-64000")
+    cursor.close()
 
 
 class TrackerDB:
@@ -131,9 +227,20 @@ class TrackerDB:
     """
 
     def __init__(self, db_url: str = "sqlite:///foia_tracker.db") -> None:
-        self.engine = create_engine(db_url, echo=False)
+        url = make_url(db_url)
+        self.engine = create_engine(url, echo=False, **_engine_options(url))
+        if _is_sqlite_file(url):
+            event.listen(self.engine, "connect", _set_sqlite_pragmas)
         Base.metadata.create_all(self.engine)
-        self.SessionFactory = sessionmaker(bind=self.engine)
+        # One reusable Session per thread. Objects stay loaded after commit,
+        # so the requests returned by write methods are usable as is once
+        # the session closes, without a refresh SELECT.
+        self.SessionFactory = scoped_session(
+            sessionmaker(bind=self.engine, expire_on_commit=False)
+        )
+        # Bumped on every write made through this instance, so readers can
+        # tell whether results derived from the database are still current.
+        self.write_version: int = 0
 
     def _session(self) -> Session:
         return self.SessionFactory()
@@ -158,9 +265,36 @@ class TrackerDB:
             )
             session.add(req)
             session.commit()
-            session.refresh(req)
+            self.write_version += 1
             return req
 
+    def bulk_create_requests(
+        self,
+        rows: Iterable[Mapping[str, Any]],
+        batch_size: int = 500,
+    ) -> int:
+        """
+        Insert many requests in one transaction and return how many were added.
+
+        Each row maps FOIARequest column names to values, as the keyword
+        arguments of create_request() do. *rows* is consumed in batches of
+        *batch_size*, each sent as a single executemany INSERT, so a large
+        iterator is never materialized. Unlike create_request(), no ORM
+        objects are built or returned.
+        """
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be positive, got {batch_size}")
+        rows = iter(rows)
+        count = 0
+        with self._session() as session:
+            while batch := [dict(row) for row in islice(rows, batch_size)]:
+                session.execute(insert(FOIARequest), batch)
+                count += len(batch)
+            session.commit()
+        if count:
+            self.write_version += 1
+        return count
+
     # ---- Read ----
 
     def get_request(self, request_id: int) -> Optional[FOIARequest]:
@@ -169,11 +303,9 @@ class TrackerDB:
 
     def get_by_reference(self, reference_id: str) -> Optional[FOIARequest]:
         with self._session() as session:
-            return (
-                session.query(FOIARequest)
-                .filter(FOIARequest.reference_id == reference_id)
-                .first()
-            )
+            return session.scalars(
+                select(FOIARequest).where(FOIARequest.reference_id == reference_id).limit(1)
+            ).first()
 
     def list_requests(
         self,
@@ -182,51 +314,219 @@ class TrackerDB:
         agency: Optional[str] = None,
         limit: int = 100,
         offset: int = 0,
+        after: Optional[tuple[datetime, int]] = None,
+        summary: bool = False,
     ) -> list[FOIARequest]:
+        """
+        List requests newest first.
+
+        For deep pagination pass *after*, the ``(date_created, id)`` of the
+        last request on the previous page, instead of an *offset*: the
+        database then seeks straight to the next page rather than scanning
+        and discarding every earlier row.
+
+        With *summary*, only the columns list views show are loaded (see
+        _SUMMARY_COLUMNS); reading any other column of the returned
+        requests raises DetachedInstanceError.
+        """
         with self._session() as session:
-            q = session.query(FOIARequest)
+            q = self._select_requests(summary)
             if jurisdiction:
-                q = q.filter(FOIARequest.jurisdiction == jurisdiction)
+                q = q.where(FOIARequest.jurisdiction == jurisdiction)
             if status:
-                q = q.filter(FOIARequest.status == status)
+                q = q.where(FOIARequest.status == status)
             if agency:
-                q = q.filter(FOIARequest.agency.ilike(f"%{agency}%"))
-            q = q.order_by(FOIARequest.date_created.desc())
-            return q.offset(offset).limit(limit).all()
+                q = q.where(FOIARequest.agency.ilike(f"%{agency}%"))
+            if after is not None:
+                q = q.where(tuple_(FOIARequest.date_created, FOIARequest.id) < tuple_(*after))
+            q = q.order_by(FOIARequest.date_created.desc(), FOIARequest.id.desc())
+            return list(session.scalars(q.offset(offset).limit(limit)))
+
+    def list_requests_in(
+        self,
+        statuses: Iterable[RequestStatus],
+        limit: int = 100,
+        offset: int = 0,
+    ) -> list[FOIARequest]:
+        """List requests whose status is any of *statuses*, in one query."""
+        with self._session() as session:
+            return list(
+                session.scalars(
+                    select(FOIARequest)
+                    .where(FOIARequest.status.in_(list(statuses)))
+                    .order_by(FOIARequest.date_created.desc())
+                    .offset(offset)
+                    .limit(limit)
+                )
+            )
 
-    def get_overdue(self) -> list[FOIARequest]:
+    def list_overdue(
+        self,
+        today: Optional[date] = None,
+        statuses: Optional[Iterable[RequestStatus]] = None,
+        summary: bool = False,
+    ) -> list[FOIARequest]:
+        """
+        List requests whose effective deadline has passed.
+
+        Only requests in *statuses* are considered; by default, every
+        request that has not reached a terminal status. *summary* is as
+        for list_requests().
+        """
+        today = today or date.today()
         with self._session() as session:
-            today = date.today()
-            terminal = [
-                RequestStatus.COMPLETE,
-                RequestStatus.DENIED,
-                RequestStatus.WITHDRAWN,
-                RequestStatus.NO_RESPONSIVE_RECORDS,
-            ]
-            return (
-                session.query(FOIARequest)
-                .filter(
-                    FOIARequest.status.notin_(terminal),
-                    (
-                        (FOIARequest.extended_deadline != None) & (FOIARequest.extended_deadline < today)
-                    )
-                    | (
-                        (FOIARequest.extended_deadline == None) & (FOIARequest.deadline != None) & (FOIARequest.deadline < today)
-                    ),
+            return list(
+                session.scalars(
+                    self._select_requests(summary)
+                    .where(self._status_clause(statuses), FOIARequest.effective_deadline < today)
+                    .order_by(FOIARequest.date_created.desc())
+                )
+            )
+
+    def iter_overdue(
+        self,
+        today: Optional[date] = None,
+        statuses: Optional[Iterable[RequestStatus]] = None,
+        batch_size: int = 200,
+        summary: bool = False,
+    ) -> Iterator[FOIARequest]:
+        """
+        Yield the requests list_overdue() would return, fetching them
+        *batch_size* rows at a time (a server-side cursor on PostgreSQL), so
+        memory stays bounded however many requests are overdue and the
+        caller can stop early.
+
+        The query runs in its own session, which stays open until the
+        iterator is exhausted or closed.
+        """
+        today = today or date.today()
+        stmt = (
+            self._select_requests(summary)
+            .where(self._status_clause(statuses), FOIARequest.effective_deadline < today)
+            .order_by(FOIARequest.date_created.desc())
+            .execution_options(yield_per=batch_size)
+        )
+        # Not the scoped session: other TrackerDB calls made while the
+        # caller iterates would close it under the open cursor.
+        with Session(self.engine, expire_on_commit=False) as session:
+            yield from session.scalars(stmt)
+
+    def list_due_within(
+        self,
+        days: int,
+        today: Optional[date] = None,
+        statuses: Optional[Iterable[RequestStatus]] = None,
+        include_overdue: bool = False,
+        summary: bool = False,
+    ) -> list[FOIARequest]:
+        """
+        List requests whose effective deadline falls between today and
+        *days* days from now, inclusive, or at any earlier date too when
+        *include_overdue* is set. *statuses* and *summary* are as for
+        list_overdue().
+        """
+        today = today or date.today()
+        until = today + timedelta(days=days)
+        if include_overdue:
+            due = FOIARequest.effective_deadline <= until
+        else:
+            due = FOIARequest.effective_deadline.between(today, until)
+        with self._session() as session:
+            return list(
+                session.scalars(
+                    self._select_requests(summary)
+                    .where(self._status_clause(statuses), due)
+                    .order_by(FOIARequest.date_created.desc())
                 )
-                .all()
             )
 
+    def get_overdue(self, columns: Optional[Iterable[Any]] = None) -> list:
+        """
+        Return overdue requests: FOIARequest objects by default, or Row
+        tuples of just *columns* (e.g. ``[FOIARequest.id, FOIARequest.agency]``),
+        which skips building ORM objects.
+        """
+        if columns is None:
+            return self.list_overdue()
+        with self._session() as session:
+            return list(session.execute(self._overdue_select(select(*columns))))
+
+    def get_overdue_ids(self, today: Optional[date] = None) -> list[int]:
+        """Return the ids of overdue requests, without loading the requests."""
+        with self._session() as session:
+            return list(
+                session.execute(self._overdue_select(select(FOIARequest.id), today)).scalars()
+            )
+
+    @staticmethod
+    def _overdue_select(stmt, today: Optional[date] = None):
+        return stmt.where(
+            TrackerDB._status_clause(None),
+            FOIARequest.effective_deadline < (today or date.today()),
+        ).order_by(FOIARequest.date_created.desc())
+
+    @staticmethod
+    def _select_requests(summary: bool = False):
+        stmt = select(FOIARequest)
+        if summary:
+            stmt = stmt.options(load_only(*_SUMMARY_COLUMNS))
+        return stmt
+
+    @staticmethod
+    def _status_clause(statuses: Optional[Iterable[RequestStatus]]):
+        if statuses is None:
+            return _NOT_TERMINAL
+        return FOIARequest.status.in_(list(statuses))
+
     def get_stats(self) -> dict[str, int]:
         with self._session() as session:
-            total = session.query(FOIARequest).count()
-            by_status: dict[str, int] = {}
-            for st in RequestStatus:
-                count = session.query(FOIARequest).filter(FOIARequest.status == st).count()
-                if count > 0:
-                    by_status[st.value] = count
-            overdue = len(self.get_overdue())
-            return {"total": total, "overdue": overdue, "by_status": by_status}
+            return self._stats(session, date.today())
+
+    def dashboard_snapshot(self, recent: int = 10) -> dict[str, Any]:
+        """
+        Return what a dashboard shows in one call: get_stats(), the
+        overdue request ids, and the *recent* newest requests (summary
+        columns only, as for list_requests()). All three are read in one
+        transaction on one connection, so they agree with each other.
+        """
+        today = date.today()
+        with self._session() as session:
+            stats = self._stats(session, today)
+            overdue_ids = list(
+                session.scalars(self._overdue_select(select(FOIARequest.id), today))
+            )
+            newest = list(
+                session.scalars(
+                    self._select_requests(summary=True)
+                    .order_by(FOIARequest.date_created.desc(), FOIARequest.id.desc())
+                    .limit(recent)
+                )
+            )
+        return {"stats": stats, "overdue_ids": overdue_ids, "recent": newest}
+
+    @staticmethod
+    def _stats(session: Session, today: date) -> dict[str, Any]:
+        # One grouped query: per-status counts, each with its overdue share.
+        # SUM(CASE ...) rather than COUNT(*) FILTER, which MySQL and SQL
+        # Server do not support.
+        overdue_clause = and_(
+            TrackerDB._status_clause(None), FOIARequest.effective_deadline < today
+        )
+        rows = session.execute(
+            select(
+                FOIARequest.status,
+                func.count(),
+                func.sum(case((overdue_clause, 1), else_=0)),
+            ).group_by(FOIARequest.status)
+        ).all()
+        counts = {status: count for status, count, _ in rows}
+        by_status = {st.value: counts[st] for st in RequestStatus if counts.get(st)}
+        return {
+            "total": sum(counts.values()),
+            # MySQL returns SUM() as a DECIMAL
+            "overdue": int(sum(overdue for _, _, overdue in rows)),
+            "by_status": by_status,
+        }
 
     # ---- Update ----
 
@@ -242,20 +542,62 @@ class TrackerDB:
                 if hasattr(req, key):
                     setattr(req, key, val)
             session.commit()
-            session.refresh(req)
+            self.write_version += 1
             return req
 
-    def add_note(self, request_id: int, note: str) -> Optional[FOIARequest]:
+    def bulk_update_status(
+        self, request_ids: Iterable[int], status: RequestStatus, **kwargs
+    ) -> int:
+        """
+        Set *status* (and any other column values in *kwargs*) on every
+        request in *request_ids* with one UPDATE, returning the number of
+        rows changed. Unlike update_status(), unknown keys are an error
+        rather than ignored, and no requests are loaded or returned.
+        """
+        columns = FOIARequest.__table__.columns
+        unknown = [key for key in kwargs if key not in columns]
+        if unknown:
+            raise ValueError(f"Unknown FOIARequest column(s): {', '.join(unknown)}")
+        ids = list(request_ids)
+        if not ids:
+            return 0
         with self._session() as session:
-            req = session.get(FOIARequest, request_id)
-            if req is None:
-                return None
-            timestamp = datetime.utcnow().strftime("%Y-%m-%d %H:%M")
-            entry = f"[{timestamp}] {note}"
-            req.notes = f"{req.notes}\n{entry}" if req.notes else entry
+            result = session.execute(
+                update(FOIARequest)
+                .where(FOIARequest.id.in_(ids))
+                .values(status=status, **kwargs)
+                .execution_options(synchronize_session=False)
+            )
             session.commit()
-            session.refresh(req)
-            return req
+            self.write_version += 1
+            return result.rowcount
+
+    def add_note(self, request_id: int, note: str) -> bool:
+        """
+        Append a timestamped note, returning False if the request does not
+        exist. The append happens in the database with a single UPDATE, so
+        the existing notes are never read back.
+        """
+        timestamp = datetime.utcnow().strftime("%Y-%m-%d %H:%M")
+        entry = f"[{timestamp}] {note}"
+        notes = FOIARequest.notes
+        with self._session() as session:
+            result = session.execute(
+                update(FOIARequest)
+                .where(FOIARequest.id == request_id)
+                .values(
+                    notes=case(
+                        (or_(notes.is_(None), notes == ""), entry),
+                        else_=notes + "\n" + entry,
+                    )
+                )
+                .execution_options(synchronize_session=False)
+            )
+            if result.rowcount == 0:
+                return False
+            session.commit()
+            self.write_version += 1
+            return True
 
     def record_response(
         self,
@@ -282,7 +624,7 @@ class TrackerDB:
             else:
                 req.status = RequestStatus.COMPLETE
             session.commit()
-            session.refresh(req)
+            self.write_version += 1
             return req
 
     # ---- Delete ----
@@ -294,4 +636,5 @@ class TrackerDB:
                 return False
             session.delete(req)
             session.commit()
+            self.write_version += 1
             return True
@@ -2,7 +2,8 @@
 Tests for FOIA/RTI request generators.
 """
 
-from datetime import date
+import io
+from datetime import date, timedelta
 
 import pytest
 
@@ -12,8 +13,16 @@ from foia_rti.generators.us_state import USStateGenerator, STATE_REGISTRY
 from foia_rti.generators.india_rti import IndiaRTIGenerator, INDIA_AGENCIES
 from foia_rti.generators.uk_foi import UKFOIGenerator, UK_AGENCIES
 from foia_rti.generators.eu_requests import EURequestGenerator, EU_INSTITUTIONS
-from foia_rti.tracker.deadlines import DeadlineCalculator, add_business_days, add_calendar_days
+from foia_rti.tracker.deadlines import (
+    JURISDICTION_RULES,
+    DeadlineCalculator,
+    add_business_days,
+    add_calendar_days,
+    compute_deadline,
+)
 from foia_rti.tracker.tracker import TrackerDB, FOIARequest, RequestStatus
+from foia_rti.tracker.alerts import AlertEngine
+from foia_rti.tracker.appeals import AppealGenerator
 from foia_rti.analysis.response_parser import ResponseParser
 from foia_rti.analysis.redaction_detector import RedactionDetector
 
@@ -22,26 +31,126 @@ from foia_rti.analysis.redaction_detector import RedactionDetector
 # Helpers
 # ---------------------------------------------------------------------------
 
+_CONTEXT_DEFAULTS = {
+    "requester_name": "Test Requester",
+    "requester_organization": "Test Org",
+    "requester_email": "test@example.org",
+    "date_range_start": date(2024, 1, 1),
+    "date_range_end": date(2025, 12, 31),
+}
+_DEFAULT_RECORDS = ("All inspection reports for licensed facilities",)
+_DEFAULT_KEYWORDS = ("AWA", "inspection")
+# Fixed date for tests whose outcome does not depend on the current date
+_FIXED_DATE = date(2025, 2, 3)
+# "Right to Information" in Hindi, present in every Hindi-language RTI
+_HINDI_MARKER = "सूचना का अधिकार"
+
+
 def _make_context(
     agency: str = "USDA-APHIS",
     topic: str = "Animal Welfare Act inspection reports",
     jurisdiction: str = "US-Federal",
     **kwargs,
 ) -> RequestContext:
-    defaults = dict(
+    # Fresh lists per context, since RequestContext fields are mutable
+    return RequestContext(
         agency=agency,
         topic=topic,
         jurisdiction=jurisdiction,
-        requester_name="Test Requester",
-        requester_organization="Test Org",
-        requester_email="test@example.org",
-        date_range_start=date(2024, 1, 1),
-        date_range_end=date(2025, 12, 31),
-        specific_records=["All inspection reports for licensed facilities"],
-        keywords=["AWA", "inspection"],
+        **{
+            **_CONTEXT_DEFAULTS,
+            "specific_records": list(_DEFAULT_RECORDS),
+            "keywords": list(_DEFAULT_KEYWORDS),
+            **kwargs,
+        },
+    )
+
+
+def _step_business_days(start: date, days: int, is_holiday=None) -> date:
+    # Reference answer for add_business_days: walk forward one day at a time
+    current, remaining = start, days
+    while remaining:
+        current += timedelta(days=1)
+        if current.weekday() < 5 and not (is_holiday and is_holiday(current)):
+            remaining -= 1
+    return current
+
+
+def _step_deadline(filed: date, rule: dict) -> date:
+    if rule["day_type"] != "business":
+        return filed + timedelta(days=rule["initial_days"])
+    return _step_business_days(filed, rule["initial_days"], rule["holiday_fn"])
+
+
+# Generators, parsers and the calculator hold no per-test state, so each is
+# built (and its templates loaded) once for the module.
+
+@pytest.fixture(scope="module")
+def us_federal_gen():
+    return USFederalGenerator()
+
+
+@pytest.fixture(scope="module")
+def us_federal_default(us_federal_gen):
+    # The request for the default context, generated once for the tests
+    # that only inspect it
+    return us_federal_gen.generate(_make_context())
+
+
+@pytest.fixture(scope="module")
+def us_federal_custom(us_federal_gen):
+    # One request with every optional field set, shared by the tests that
+    # check each field shows up in the output
+    return us_federal_gen.generate(
+        _make_context(
+            agency="EPA",
+            specific_records=["Record type A", "Record type B"],
+            keywords=["ammonia", "CAFO", "discharge"],
+            expedited_processing=True,
+        )
     )
-    defaults.update(kwargs)
-    return RequestContext(**defaults)
+
+
+@pytest.fixture(scope="module")
+def us_state_gen():
+    return USStateGenerator()
+
+
+@pytest.fixture(scope="module")
+def india_gen():
+    return IndiaRTIGenerator()
+
+
+@pytest.fixture(scope="module")
+def uk_gen():
+    return UKFOIGenerator()
+
+
+@pytest.fixture(scope="module")
+def eu_gen():
+    return EURequestGenerator()
+
+
+@pytest.fixture(scope="module")
+def calc():
+    return DeadlineCalculator()
+
+
+@pytest.fixture(scope="module")
+def parser():
+    return ResponseParser()
+
+
+@pytest.fixture(scope="module")
+def detector():
+    return RedactionDetector()
+
+
+@pytest.fixture(scope="module")
+def tracker_db():
+    # One in-memory database for the module; tests empty the table rather
+    # than re-running the schema DDL on a new engine each time.
+    return TrackerDB("sqlite:///:memory:")
 
 
 # ---------------------------------------------------------------------------
@@ -49,31 +158,27 @@ def _make_context(
 # ---------------------------------------------------------------------------
 
 class TestUSFederalGenerator:
-    def setup_method(self):
-        self.gen = USFederalGenerator()
+    @pytest.fixture(autouse=True)
+    def _shared(self, us_federal_gen):
+        self.gen = us_federal_gen
 
-    def test_generate_basic_request(self):
-        ctx = _make_context()
-        result = self.gen.generate(ctx)
+    def test_generate_basic_request(self, us_federal_default):
+        result = us_federal_default
         assert isinstance(result, GeneratedRequest)
         assert result.jurisdiction == "US-Federal"
         assert "5 U.S.C." in result.legal_basis
         assert result.estimated_deadline_days == 20
 
-    def test_request_contains_legal_citation(self):
-        ctx = _make_context()
-        result = self.gen.generate(ctx)
-        assert "5 U.S.C. \u00a7 552" in result.text
+    def test_request_contains_legal_citation(self, us_federal_default):
+        assert "5 U.S.C. \u00a7 552" in us_federal_default.text
 
-    def test_request_contains_agency_name(self):
-        ctx = _make_context(agency="EPA")
-        result = self.gen.generate(ctx)
-        assert "Environmental Protection Agency" in result.text
+    def test_request_contains_agency_name(self, us_federal_custom):
+        assert "Environmental Protection Agency" in us_federal_custom.text
 
-    def test_request_contains_fee_waiver(self):
-        ctx = _make_context(fee_waiver=True)
-        result = self.gen.generate(ctx)
-        assert "fee waiver" in result.text.lower() or "FEE WAIVER" in result.text
+    def test_request_contains_fee_waiver(self, us_federal_default):
+        # fee_waiver defaults to True
+        text = us_federal_default.text
+        assert "fee waiver" in text.lower() or "FEE WAIVER" in text
 
     def test_request_without_fee_waiver(self):
         ctx = _make_context(fee_waiver=False)
@@ -81,44 +186,41 @@ class TestUSFederalGenerator:
         # Fee waiver section should not appear
         assert "FEE WAIVER REQUEST" not in result.text
 
-    def test_request_contains_date_range(self):
-        ctx = _make_context()
-        result = self.gen.generate(ctx)
-        assert "January 01, 2024" in result.text
-        assert "December 31, 2025" in result.text
+    def test_request_contains_date_range(self, us_federal_default):
+        assert "January 01, 2024" in us_federal_default.text
+        assert "December 31, 2025" in us_federal_default.text
 
-    def test_request_contains_specific_records(self):
-        ctx = _make_context(specific_records=["Record type A", "Record type B"])
-        result = self.gen.generate(ctx)
-        assert "Record type A" in result.text
-        assert "Record type B" in result.text
+    def test_request_contains_specific_records(self, us_federal_custom):
+        assert "Record type A" in us_federal_custom.text
+        assert "Record type B" in us_federal_custom.text
 
-    def test_request_contains_keywords(self):
-        ctx = _make_context(keywords=["ammonia", "CAFO", "discharge"])
-        result = self.gen.generate(ctx)
-        assert "ammonia" in result.text
-        assert "CAFO" in result.text
+    def test_request_contains_keywords(self, us_federal_custom):
+        assert "ammonia" in us_federal_custom.text
+        assert "CAFO" in us_federal_custom.text
 
-    def test_request_expedited_processing(self):
-        ctx = _make_context(expedited_processing=True)
-        result = self.gen.generate(ctx)
-        assert "expedited processing" in result.text.lower()
+    def test_request_expedited_processing(self, us_federal_custom):
+        assert "expedited processing" in us_federal_custom.text.lower()
+
+    def test_default_request_not_expedited(self, us_federal_default):
+        assert "expedited processing" not in us_federal_default.text.lower()
 
     def test_unknown_agency_raises(self):
         ctx = _make_context(agency="NONEXISTENT_AGENCY_XYZ")
         with pytest.raises(ValueError, match="Unknown agency"):
             self.gen.generate(ctx)
 
-    def test_agency_aliases(self):
-        for alias in ["USDA", "APHIS", "FSIS", "EPA", "FDA", "OSHA"]:
-            ctx = _make_context(agency=alias)
-            result = self.gen.generate(ctx)
-            assert isinstance(result, GeneratedRequest)
+    @pytest.mark.parametrize("alias", ["USDA", "APHIS", "FSIS", "EPA", "FDA", "OSHA"])
+    def test_agency_aliases(self, alias):
+        ctx = _make_context(agency=alias)
+        result = self.gen.generate(ctx)
+        assert isinstance(result, GeneratedRequest)
 
-    def test_all_agencies_registered(self):
-        expected = ["USDA-APHIS", "USDA-FSIS", "USDA-AMS", "USDA-FSA", "EPA", "FDA", "OSHA", "USDA-NRCS"]
-        for agency_key in expected:
-            assert agency_key in US_FEDERAL_AGENCIES
+    @pytest.mark.parametrize(
+        "agency_key",
+        ["USDA-APHIS", "USDA-FSIS", "USDA-AMS", "USDA-FSA", "EPA", "FDA", "OSHA", "USDA-NRCS"],
+    )
+    def test_all_agencies_registered(self, agency_key):
+        assert agency_key in US_FEDERAL_AGENCIES
 
     def test_get_agencies(self):
         agencies = self.gen.get_agencies()
@@ -135,19 +237,42 @@ class TestUSFederalGenerator:
         assert "OGIS" in info["ogis"] or "ogis" in info["ogis"]
 
     def test_template_loading(self):
-        templates = self.gen.list_templates()
-        assert len(templates) >= 20
+        assert self.gen.count_templates() >= 20
+
+    def test_count_templates_matches_list(self):
+        assert self.gen.count_templates() == len(self.gen.list_templates())
 
     def test_generate_with_template(self):
         ctx = _make_context(template_id="usda-aphis-inspection-reports")
         result = self.gen.generate(ctx)
         assert "inspection" in result.text.lower()
 
-    def test_metadata_includes_email(self):
-        ctx = _make_context(agency="EPA")
-        result = self.gen.generate(ctx)
-        assert "agency_email" in result.metadata
-        assert "@" in result.metadata["agency_email"]
+    def test_generate_with_template_leaves_context_unchanged(self):
+        ctx = _make_context(template_id="usda-aphis-inspection-reports", keywords=[])
+        first = self.gen.generate(ctx)
+        second = self.gen.generate(ctx)
+        assert first.text == second.text
+        assert ctx.specific_records == ["All inspection reports for licensed facilities"]
+        assert ctx.keywords == []
+        assert len(first.context.specific_records) > 1
+
+    def test_metadata_includes_email(self, us_federal_custom):
+        assert "agency_email" in us_federal_custom.metadata
+        assert "@" in us_federal_custom.metadata["agency_email"]
+
+    def test_generate_many_matches_generate(self):
+        kwargs_list = [
+            {"agency": "EPA"},
+            {"agency": "FSIS"},
+            {"agency": "EPA", "fee_waiver": False},
+        ]
+        expected = [self.gen.generate(_make_context(**kw)).text for kw in kwargs_list]
+        results = self.gen.generate_many(_make_context(**kw) for kw in kwargs_list)
+        assert [r.text for r in results] == expected
+
+    def test_generate_many_unknown_agency_raises(self):
+        with pytest.raises(ValueError, match="Unknown agency"):
+            list(self.gen.generate_many([_make_context(agency="NOT-AN-AGENCY")]))
 
 
 # ---------------------------------------------------------------------------
@@ -155,8 +280,9 @@ class TestUSFederalGenerator:
 # ---------------------------------------------------------------------------
 
 class TestUSStateGenerator:
-    def setup_method(self):
-        self.gen = USStateGenerator()
+    @pytest.fixture(autouse=True)
+    def _shared(self, us_state_gen):
+        self.gen = us_state_gen
 
     def test_generate_iowa_request(self):
         ctx = _make_context(
@@ -183,9 +309,27 @@ class TestUSStateGenerator:
         result = self.gen.generate(ctx)
         assert "Cal. Gov" in result.text or "California" in result.text
 
-    def test_all_states_have_agencies(self):
-        for abbr, info in STATE_REGISTRY.items():
-            assert len(info.key_agencies) >= 1, f"State {abbr} has no agencies"
+    def test_agency_resolved_by_full_name(self):
+        ctx = _make_context(
+            agency="Texas Animal Health Commission",
+            jurisdiction="TX",
+        )
+        result = self.gen.generate(ctx)
+        assert result.agency == "Texas Animal Health Commission"
+
+    def test_repeat_generate_tracks_context(self):
+        first = self.gen.generate(_make_context(agency="TCEQ", jurisdiction="TX"))
+        again = self.gen.generate(_make_context(agency="TCEQ", jurisdiction="TX"))
+        changed = self.gen.generate(
+            _make_context(agency="TCEQ", jurisdiction="TX", specific_records=["Permit files"])
+        )
+        assert again.text == first.text
+        assert "Permit files" in changed.text
+        assert "Permit files" not in first.text
+
+    @pytest.mark.parametrize("abbr", sorted(STATE_REGISTRY))
+    def test_all_states_have_agencies(self, abbr):
+        assert len(STATE_REGISTRY[abbr].key_agencies) >= 1, f"State {abbr} has no agencies"
 
     def test_supported_states_count(self):
         states = self.gen.get_supported_states()
@@ -207,8 +351,9 @@ class TestUSStateGenerator:
 # ---------------------------------------------------------------------------
 
 class TestIndiaRTIGenerator:
-    def setup_method(self):
-        self.gen = IndiaRTIGenerator()
+    @pytest.fixture(autouse=True)
+    def _shared(self, india_gen):
+        self.gen = india_gen
 
     def test_generate_english_request(self):
         ctx = _make_context(
@@ -229,35 +374,45 @@ class TestIndiaRTIGenerator:
         )
         result = self.gen.generate(ctx, language="hindi")
         # Should contain Hindi text
-        assert "सूचना का अधिकार" in result.text
+        assert _HINDI_MARKER in result.text
 
     def test_fee_note_present(self):
         ctx = _make_context(agency="FSSAI", jurisdiction="India")
         result = self.gen.generate(ctx, language="english")
         assert "Rs. 10" in result.text
 
-    def test_all_agencies_registered(self):
-        expected = ["AWBI", "FSSAI", "CPCB", "DAHD", "MoEFCC"]
-        for key in expected:
-            assert key in INDIA_AGENCIES
+    @pytest.mark.parametrize("key", ["AWBI", "FSSAI", "CPCB", "DAHD", "MoEFCC"])
+    def test_all_agencies_registered(self, key):
+        assert key in INDIA_AGENCIES
 
     def test_template_loading(self):
-        templates = self.gen.list_templates()
-        assert len(templates) >= 10
+        assert self.gen.count_templates() >= 10
 
     def test_bpl_exemption(self):
         ctx = _make_context(agency="AWBI", jurisdiction="India")
         result = self.gen.generate(ctx, bpl=True)
         assert "Below Poverty Line" in result.text or "BPL" in result.text
 
+    def test_generate_many(self):
+        contexts = [
+            _make_context(agency=agency, jurisdiction="India")
+            for agency in ("AWBI", "FSSAI", "CPCB")
+        ]
+        results = list(self.gen.generate_many(contexts, language="hindi"))
+        assert [r.agency for r in results] == [
+            INDIA_AGENCIES[key]["full_name"] for key in ("AWBI", "FSSAI", "CPCB")
+        ]
+        assert all(_HINDI_MARKER in r.text for r in results)
+
 
 # ---------------------------------------------------------------------------
 # UK FOI Generator
 # ---------------------------------------------------------------------------
 
 class TestUKFOIGenerator:
-    def setup_method(self):
-        self.gen = UKFOIGenerator()
+    @pytest.fixture(autouse=True)
+    def _shared(self, uk_gen):
+        self.gen = uk_gen
 
     def test_generate_defra_request(self):
         ctx = _make_context(
@@ -279,10 +434,9 @@ class TestUKFOIGenerator:
         result = self.gen.generate(ctx, eir=False)
         assert "Environmental Information Regulations" not in result.text
 
-    def test_all_agencies_registered(self):
-        expected = ["DEFRA", "FSA", "EA", "APHA", "VMD"]
-        for key in expected:
-            assert key in UK_AGENCIES
+    @pytest.mark.parametrize("key", ["DEFRA", "FSA", "EA", "APHA", "VMD"])
+    def test_all_agencies_registered(self, key):
+        assert key in UK_AGENCIES
 
 
 # ---------------------------------------------------------------------------
@@ -290,8 +444,9 @@ class TestUKFOIGenerator:
 # ---------------------------------------------------------------------------
 
 class TestEURequestGenerator:
-    def setup_method(self):
-        self.gen = EURequestGenerator()
+    @pytest.fixture(autouse=True)
+    def _shared(self, eu_gen):
+        self.gen = eu_gen
 
     def test_generate_dg_sante_request(self):
         ctx = _make_context(
@@ -308,10 +463,9 @@ class TestEURequestGenerator:
         result = self.gen.generate(ctx)
         assert "1367/2006" in result.text or "Aarhus" in result.text
 
-    def test_all_institutions_registered(self):
-        expected = ["EC-DG-SANTE", "EC-DG-AGRI", "EC-DG-ENV", "EFSA", "ECA"]
-        for key in expected:
-            assert key in EU_INSTITUTIONS
+    @pytest.mark.parametrize("key", ["EC-DG-SANTE", "EC-DG-AGRI", "EC-DG-ENV", "EFSA", "ECA"])
+    def test_all_institutions_registered(self, key):
+        assert key in EU_INSTITUTIONS
 
 
 # ---------------------------------------------------------------------------
@@ -319,34 +473,28 @@ class TestEURequestGenerator:
 # ---------------------------------------------------------------------------
 
 class TestDeadlineCalculator:
-    def setup_method(self):
-        self.calc = DeadlineCalculator()
-
-    def test_us_federal_20_business_days(self):
-        # Monday Feb 3, 2025 + 20 biz days = Monday Mar 3, 2025
-        filed = date(2025, 2, 3)
-        deadline = self.calc.calculate("US-Federal", filed)
-        assert deadline.weekday() < 5  # Should be a weekday
-        # Approximately 4 weeks of business days
-        delta = (deadline - filed).days
-        assert 25 <= delta <= 32  # 20 business days is ~28 calendar days
-
-    def test_india_30_calendar_days(self):
-        filed = date(2025, 2, 1)
-        deadline = self.calc.calculate("India", filed)
-        assert deadline == date(2025, 3, 3)
-
-    def test_uk_20_working_days(self):
-        filed = date(2025, 2, 3)
-        deadline = self.calc.calculate("UK", filed)
-        delta = (deadline - filed).days
-        assert 25 <= delta <= 32
-
-    def test_eu_15_working_days(self):
-        filed = date(2025, 2, 3)
-        deadline = self.calc.calculate("EU", filed)
-        delta = (deadline - filed).days
-        assert 18 <= delta <= 25
+    @pytest.fixture(autouse=True)
+    def _shared(self, calc):
+        self.calc = calc
+
+    @pytest.mark.parametrize(
+        "jurisdiction, filed, expected",
+        [
+            # 20 business days; Presidents' Day (Feb 17) pushes it one day
+            ("US-Federal", date(2025, 2, 3), date(2025, 3, 4)),
+            # 20 working days, no bank holidays in the period
+            ("UK", date(2025, 2, 3), date(2025, 3, 3)),
+            # 15 working days
+            ("EU", date(2025, 2, 3), date(2025, 2, 24)),
+            # 30 calendar days
+            ("India", date(2025, 2, 1), date(2025, 3, 3)),
+        ],
+        ids=["US-Federal", "UK", "EU", "India"],
+    )
+    def test_initial_deadline(self, jurisdiction, filed, expected):
+        deadline = self.calc.calculate(jurisdiction, filed)
+        assert deadline == expected
+        assert deadline == _step_deadline(filed, JURISDICTION_RULES[jurisdiction])
 
     def test_extension_us_federal(self):
         filed = date(2025, 2, 3)
@@ -368,11 +516,54 @@ class TestDeadlineCalculator:
         assert result == date(2025, 2, 10)
         assert result.weekday() == 0  # Monday
 
+    def test_add_business_days_skips_holidays(self):
+        # Dec 25 and 26 are holidays here; Dec 28-29 is a weekend
+        def christmas(d):
+            return d.month == 12 and d.day in (25, 26)
+
+        assert add_business_days(date(2024, 12, 24), 2, christmas) == date(2024, 12, 30)
+        # Thanksgiving 2024 (Nov 28) across a full US federal deadline
+        deadline = self.calc.calculate("US-Federal", date(2024, 11, 20))
+        assert deadline == date(2024, 12, 19)
+
+    @pytest.mark.parametrize(
+        "holiday_fn",
+        [
+            None,
+            JURISDICTION_RULES["US-Federal"]["holiday_fn"],
+            JURISDICTION_RULES["UK"]["holiday_fn"],
+        ],
+        ids=["no-holidays", "us-federal", "uk"],
+    )
+    def test_add_business_days_matches_reference(self, holiday_fn):
+        # Every start weekday across a year end, for short and long periods
+        starts = [date(2024, 12, 20) + timedelta(days=i) for i in range(14)]
+        counts = [*range(0, 31), 45, 90, 260, 400]
+        for start in starts:
+            for days in counts:
+                assert add_business_days(start, days, holiday_fn) == _step_business_days(
+                    start, days, holiday_fn
+                ), (start, days)
+
     def test_add_calendar_days(self):
         start = date(2025, 2, 1)
         result = add_calendar_days(start, 30)
         assert result == date(2025, 3, 3)
 
+    def test_compute_deadline_matches_calculator(self):
+        filed = date(2025, 2, 3)
+        for jurisdiction in ("US-Federal", "India", "UK", "EU", "US-State-IA"):
+            assert compute_deadline(jurisdiction, filed) == self.calc.calculate(
+                jurisdiction, filed
+            )
+        custom = DeadlineCalculator({"Atlantis": {"initial_days": 5, "day_type": "calendar"}})
+        assert compute_deadline("Atlantis", filed, custom.rules) == date(2025, 2, 8)
+
+    def test_us_federal_notes_use_section_sign(self):
+        notes = self.calc.get_jurisdiction_info("US-Federal")["notes"]
+        assert "§ 552(a)(6)(A)(i)" in notes
+        assert "ยง" not in notes
+
     def test_unknown_jurisdiction_raises(self):
         with pytest.raises(ValueError, match="No deadline rules"):
             self.calc.calculate("Atlantis", date(2025, 1, 1))
@@ -390,8 +581,11 @@ class TestDeadlineCalculator:
 # ---------------------------------------------------------------------------
 
 class TestTrackerDB:
-    def setup_method(self):
-        self.db = TrackerDB("sqlite:///:memory:")
+    @pytest.fixture(autouse=True)
+    def _shared(self, tracker_db):
+        with tracker_db.engine.begin() as conn:
+            conn.execute(FOIARequest.__table__.delete())
+        self.db = tracker_db
 
     def test_create_and_retrieve(self):
         req = self.db.create_request(
@@ -410,8 +604,24 @@ class TestTrackerDB:
             jurisdiction="US-Federal",
             topic="CAFO permits",
         )
-        updated = self.db.update_status(req.id, RequestStatus.FILED, date_filed=date.today())
+        updated = self.db.update_status(req.id, RequestStatus.FILED, date_filed=_FIXED_DATE)
         assert updated.status == RequestStatus.FILED
+        assert updated.date_filed == _FIXED_DATE
+
+    def test_bulk_update_status(self):
+        ids = [
+            self.db.create_request(agency=a, jurisdiction="UK", topic="T").id
+            for a in ("A", "B", "C")
+        ]
+        updated = self.db.bulk_update_status(
+            ids[:2], RequestStatus.FILED, date_filed=date(2025, 1, 2)
+        )
+        assert updated == 2
+        statuses = [self.db.get_request(i).status for i in ids]
+        assert statuses == [RequestStatus.FILED, RequestStatus.FILED, RequestStatus.DRAFT]
+        assert self.db.get_request(ids[0]).date_filed == date(2025, 1, 2)
+        with pytest.raises(ValueError, match="Unknown FOIARequest column"):
+            self.db.bulk_update_status(ids, RequestStatus.FILED, colour="red")
 
     def test_list_requests(self):
         self.db.create_request(agency="A", jurisdiction="US-Federal", topic="T1")
@@ -421,6 +631,100 @@ class TestTrackerDB:
         us_reqs = self.db.list_requests(jurisdiction="US-Federal")
         assert len(us_reqs) == 1
 
+    def test_bulk_create_requests(self):
+        rows = (
+            {"agency": f"A{i}", "jurisdiction": "UK", "topic": "T", "status": RequestStatus.FILED}
+            for i in range(7)
+        )
+        assert self.db.bulk_create_requests(rows, batch_size=3) == 7
+        reqs = self.db.list_requests(jurisdiction="UK")
+        assert len(reqs) == 7
+        assert all(r.status == RequestStatus.FILED and r.date_created for r in reqs)
+        assert self.db.bulk_create_requests([]) == 0
+
+    def test_list_requests_keyset_pages(self):
+        for i in range(5):
+            self.db.create_request(agency=f"A{i}", jurisdiction="UK", topic="T")
+        first = self.db.list_requests(limit=2)
+        last = first[-1]
+        second = self.db.list_requests(limit=2, after=(last.date_created, last.id))
+        assert [r.id for r in first + second] == [r.id for r in self.db.list_requests(limit=4)]
+
+    def test_list_requests_summary_skips_text_columns(self):
+        self.db.create_request(agency="A", jurisdiction="UK", topic="T", notes="long notes")
+        (req,) = self.db.list_requests(summary=True)
+        assert (req.agency, req.jurisdiction, req.topic) == ("A", "UK", "T")
+        assert "notes" not in req.__dict__
+
+    def test_list_requests_in(self):
+        for agency, status in (
+            ("A", RequestStatus.FILED),
+            ("B", RequestStatus.APPEALED),
+            ("C", RequestStatus.COMPLETE),
+        ):
+            self.db.create_request(agency=agency, jurisdiction="UK", topic="T", status=status)
+        reqs = self.db.list_requests_in([RequestStatus.FILED, RequestStatus.APPEALED])
+        assert sorted(r.agency for r in reqs) == ["A", "B"]
+
+    def test_alerts_refresh_after_write(self):
+        engine = AlertEngine(self.db)
+        req = self.db.create_request(
+            agency="A",
+            jurisdiction="UK",
+            topic="T",
+            status=RequestStatus.FILED,
+            deadline=date.today() - timedelta(days=1),
+        )
+        assert [a.request_id for a in engine.check_overdue()] == [req.id]
+        self.db.update_status(req.id, RequestStatus.COMPLETE)
+        assert engine.check_overdue() == []
+        assert engine.check_all() == []
+
+    def test_alerts_see_external_writes_after_ttl(self):
+        engine = AlertEngine(self.db)
+        req = self.db.create_request(
+            agency="A",
+            jurisdiction="UK",
+            topic="T",
+            status=RequestStatus.FILED,
+            deadline=date.today() - timedelta(days=1),
+        )
+        assert len(engine.check_overdue()) == 1
+        # A write that bypasses this TrackerDB does not bump write_version
+        with self.db.engine.begin() as conn:
+            conn.execute(
+                FOIARequest.__table__.update()
+                .where(FOIARequest.id == req.id)
+                .values(status=RequestStatus.COMPLETE)
+            )
+        engine.MEMO_TTL = 0.0
+        assert engine.check_overdue() == []
+
+    def test_alerts_to_jsonable_matches_to_dict(self):
+        for offset in (-3, 1, 4):
+            self.db.create_request(
+                agency="A",
+                jurisdiction="EU",
+                topic="T",
+                status=RequestStatus.FILED,
+                deadline=date.today() + timedelta(days=offset),
+            )
+        alerts = AlertEngine(self.db).check_all()
+        assert len(alerts) == 3
+        assert AlertEngine.alerts_to_jsonable(alerts) == [a.to_dict() for a in alerts]
+        assert alerts[0].to_dict()["severity"] == "overdue"
+
+    def test_state_overdue_action(self):
+        self.db.create_request(
+            agency="Iowa DNR",
+            jurisdiction="US-State-IA",
+            topic="T",
+            status=RequestStatus.FILED,
+            deadline=date.today() - timedelta(days=2),
+        )
+        (alert,) = AlertEngine(self.db).check_overdue()
+        assert "state public records law" in alert.suggested_action
+
     def test_add_note(self):
         req = self.db.create_request(agency="A", jurisdiction="UK", topic="T")
         self.db.add_note(req.id, "First note")
@@ -428,6 +732,8 @@ class TestTrackerDB:
         updated = self.db.get_request(req.id)
         assert "First note" in updated.notes
         assert "Second note" in updated.notes
+        assert updated.notes.count("\n") == 1
+        assert self.db.add_note(999, "Missing") is False
 
     def test_record_response(self):
         req = self.db.create_request(agency="A", jurisdiction="EU", topic="T")
@@ -454,6 +760,20 @@ class TestTrackerDB:
         stats = self.db.get_stats()
         assert stats["total"] == 2
 
+    def test_dashboard_snapshot(self):
+        late = self.db.create_request(
+            agency="A",
+            jurisdiction="UK",
+            topic="T",
+            deadline=date(2024, 2, 1),
+            status=RequestStatus.FILED,
+        )
+        newer = self.db.create_request(agency="B", jurisdiction="UK", topic="T")
+        snapshot = self.db.dashboard_snapshot(recent=1)
+        assert snapshot["stats"] == self.db.get_stats()
+        assert snapshot["overdue_ids"] == [late.id]
+        assert [r.id for r in snapshot["recent"]] == [newer.id]
+
     def test_overdue_detection(self):
         req = self.db.create_request(
             agency="A",
@@ -467,34 +787,135 @@ class TestTrackerDB:
         assert len(overdue) >= 1
         assert overdue[0].id == req.id
 
+    def test_iter_overdue_streams_in_batches(self):
+        for i in range(5):
+            self.db.create_request(
+                agency=f"A{i}",
+                jurisdiction="UK",
+                topic="T",
+                deadline=date(2024, 2, 1),
+                status=RequestStatus.FILED,
+            )
+        streamed = self.db.iter_overdue(batch_size=2)
+        first = next(streamed)
+        # Other tracker calls mid-iteration must not disturb the stream
+        assert len(self.db.list_requests()) == 5
+        ids = [first.id] + [r.id for r in streamed]
+        assert ids == [r.id for r in self.db.list_overdue()]
+
+    def test_overdue_ids_and_columns(self):
+        late = self.db.create_request(
+            agency="A",
+            jurisdiction="UK",
+            topic="T",
+            deadline=date(2024, 2, 1),
+            status=RequestStatus.FILED,
+        )
+        self.db.create_request(
+            agency="B",
+            jurisdiction="UK",
+            topic="T",
+            deadline=date.today() + timedelta(days=30),
+            status=RequestStatus.FILED,
+        )
+        assert self.db.get_overdue_ids() == [late.id]
+        rows = self.db.get_overdue([FOIARequest.id, FOIARequest.agency])
+        assert [tuple(r) for r in rows] == [(late.id, "A")]
+
+    def test_is_overdue_as_of(self):
+        req = self.db.create_request(
+            agency="A",
+            jurisdiction="UK",
+            topic="T",
+            deadline=date(2024, 2, 1),
+            status=RequestStatus.FILED,
+        )
+        assert not req.is_overdue(date(2024, 2, 1))
+        assert req.is_overdue(date(2024, 2, 2))
+        assert req.days_until_deadline(date(2024, 1, 30)) == 2
+
+    def test_extended_deadline_overrides_deadline(self):
+        today = date(2024, 3, 1)
+        extended = self.db.create_request(
+            agency="A",
+            jurisdiction="UK",
+            topic="T",
+            deadline=date(2024, 2, 1),
+            extended_deadline=date(2024, 3, 5),
+            status=RequestStatus.EXTENDED,
+        )
+        late = self.db.create_request(
+            agency="B",
+            jurisdiction="UK",
+            topic="T",
+            deadline=date(2024, 2, 20),
+            status=RequestStatus.FILED,
+        )
+        assert [r.id for r in self.db.list_overdue(today)] == [late.id]
+        assert [r.id for r in self.db.list_due_within(7, today)] == [extended.id]
+        due = self.db.list_due_within(7, today, include_overdue=True)
+        assert sorted(r.id for r in due) == [extended.id, late.id]
+
+    def test_appeal_dates_render_as_text(self):
+        req = self.db.create_request(
+            agency="EPA",
+            jurisdiction="US-Federal",
+            topic="T",
+            date_filed=date(2024, 1, 2),
+            date_response=date(2024, 3, 15),
+            status=RequestStatus.DENIED,
+        )
+        text = AppealGenerator().generate_appeal(req)
+        assert "Date of Adverse Determination: March 15, 2024" in text
+        assert "('" not in text and ",)" not in text
+
+    def test_appeals_bulk_matches_generate_appeal(self):
+        reqs = [
+            self.db.create_request(
+                agency="A",
+                jurisdiction=jurisdiction,
+                topic="T",
+                date_filed=date(2024, 1, 1),
+                deadline=date(2024, 2, 1),
+                status=RequestStatus.FILED,
+            )
+            for jurisdiction in ("US-Federal", "India", "US-State-IA")
+        ]
+        gen = AppealGenerator()
+        out = io.StringIO()
+        assert gen.generate_appeals_bulk(reqs, out, separator="\n---\n") == 3
+        assert out.getvalue() == "\n---\n".join(gen.generate_appeal(r) for r in reqs)
+
 
 # ---------------------------------------------------------------------------
 # Response Parser
 # ---------------------------------------------------------------------------
 
 class TestResponseParser:
-    def setup_method(self):
-        self.parser = ResponseParser()
-
-    def test_detect_full_grant(self):
-        text = "We are granting your request in full. 150 pages released."
-        result = self.parser.parse(text, "US-Federal")
-        assert result.determination == "full_grant"
-
-    def test_detect_partial_grant(self):
-        text = "Your request is granted in part. 100 pages released. 50 pages withheld under (b)(4)."
-        result = self.parser.parse(text, "US-Federal")
-        assert result.determination == "partial_grant"
-
-    def test_detect_denial(self):
-        text = "Your request is denied pursuant to Exemption (b)(7)(A)."
-        result = self.parser.parse(text, "US-Federal")
-        assert result.determination == "denial"
-
-    def test_detect_no_records(self):
-        text = "A thorough search was conducted. No responsive records were located."
+    @pytest.fixture(autouse=True)
+    def _shared(self, parser):
+        self.parser = parser
+
+    @pytest.mark.parametrize(
+        "text, determination",
+        [
+            ("We are granting your request in full. 150 pages released.", "full_grant"),
+            (
+                "Your request is granted in part. 100 pages released. "
+                "50 pages withheld under (b)(4).",
+                "partial_grant",
+            ),
+            ("Your request is denied pursuant to Exemption (b)(7)(A).", "denial"),
+            (
+                "A thorough search was conducted. No responsive records were located.",
+                "no_records",
+            ),
+        ],
+        ids=["full_grant", "partial_grant", "denial", "no_records"],
+    )
+    def test_detect_determination(self, text, determination):
         result = self.parser.parse(text, "US-Federal")
-        assert result.determination == "no_records"
+        assert result.determination == determination
 
     def test_extract_us_exemptions(self):
         text = "Portions withheld under (b)(4) and (b)(6). Also (b)(7)(C) applied."
@@ -514,26 +935,27 @@ class TestResponseParser:
         result = self.parser.parse(text, "US-Federal")
         assert "FOIA-2026-00345" in result.tracking_number
 
-    def test_detect_fee_waiver_granted(self):
-        text = "Your fee waiver request has been granted."
-        result = self.parser.parse(text, "US-Federal")
-        assert result.fee_waiver_granted is True
-
-    def test_detect_fee_waiver_denied(self):
-        text = "Your fee waiver request has been denied."
+    @pytest.mark.parametrize(
+        "text, granted",
+        [
+            ("Your fee waiver request has been granted.", True),
+            ("Your fee waiver request has been denied.", False),
+        ],
+        ids=["granted", "denied"],
+    )
+    def test_detect_fee_waiver(self, text, granted):
         result = self.parser.parse(text, "US-Federal")
-        assert result.fee_waiver_granted is False
+        assert result.fee_waiver_granted is granted
 
     def test_extract_uk_exemptions(self):
         text = "Information withheld under Section 43 (commercial interests) and Section 40 (personal data)."
         result = self.parser.parse(text, "UK")
-        assert any("43" in e for e in result.exemptions)
-        assert any("40" in e for e in result.exemptions)
+        assert {"Section 43", "Section 40"} <= set(result.exemptions)
 
     def test_extract_india_exemptions(self):
         text = "Information denied under Section 8(1)(d) of the RTI Act."
         result = self.parser.parse(text, "India")
-        assert any("8(1)(d)" in e for e in result.exemptions)
+        assert "Section 8(1)(d)" in result.exemptions
 
 
 # ---------------------------------------------------------------------------
@@ -541,9 +963,10 @@ class TestResponseParser:
 # ---------------------------------------------------------------------------
 
 class TestRedactionDetector:
-    def setup_method(self):
-        self.detector = RedactionDetector()
-        self.parser = ResponseParser()
+    @pytest.fixture(autouse=True)
+    def _shared(self, detector, parser):
+        self.detector = detector
+        self.parser = parser
 
     def test_flag_excessive_withholding(self):
         text = "We are releasing 20 pages. 180 pages were withheld under (b)(4)."